@@ -12,12 +12,44 @@ import pandas as pd
 import base64
 import io
 import time
-from typing import Dict, List, Any
+import threading
+import warnings
+from io import BytesIO
+from typing import Dict, List, Any, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # GUI 없는 백엔드 사용
+import matplotlib.pyplot as plt
 
 # 로컬 모듈 임포트
 from quantum_synth import QuantumCircuitSynthesizer, SynthConfig
 from quantum_engine import QuantumSynthEngine
 from audio_generator import AudioGenerator
+import audio_kernels
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+
+@st.cache_resource
+def resolve_circuit_style() -> Optional[str]:
+    """mpl 회로 스타일 확인 (한 번만 수행 - 'iqp' 사용 가능 시 'iqp', 아니면 기본 스타일)"""
+    try:
+        from qiskit.visualization.circuit.qcstyle import load_style
+        with warnings.catch_warnings():
+            # 스타일 파일이 없으면 경고 후 기본값을 쓰므로 경고를 실패로 취급
+            warnings.simplefilter('error')
+            load_style('iqp')
+        return 'iqp'
+    except Exception:
+        return None
+
+
+_CIRCUIT_STYLE = resolve_circuit_style()
+
+# 회로 다이어그램용 Figure (재사용하여 Agg 캔버스 생성 비용 절감)
+_CIRCUIT_FIG = plt.figure()
+_CIRCUIT_FIG_LOCK = threading.Lock()
+
+# 읽기 전용 차트용 Plotly 설정 (모드바 제거로 프론트엔드 렌더링 비용 절감)
+PLOTLY_CHART_CONFIG = {'displayModeBar': False, 'staticPlot': False, 'responsive': True}
 
 # 페이지 설정
 st.set_page_config(
@@ -28,7 +60,10 @@ st.set_page_config(
 )
 
 # 커스텀 CSS
-st.markdown("""
+@st.cache_resource
+def get_custom_css() -> str:
+    """커스텀 CSS 블록 (프로세스당 한 번만 생성)"""
+    return """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -152,7 +187,11 @@ st.markdown("""
         margin: 0.5rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# Streamlit은 재실행 시 다시 그리지 않은 요소를 제거하므로 매 실행마다 출력해야 함
+st.markdown(get_custom_css(), unsafe_allow_html=True)
 
 
 @st.cache_resource
@@ -165,76 +204,107 @@ def initialize_synthesizer():
         measurement_shots=1024,
         master_volume=0.8
     )
+    # 오디오 커널 JIT 컴파일/캐시 로드를 첫 합성 전에 수행
+    audio_kernels.warmup()
     return QuantumCircuitSynthesizer(config)
 
 
-def create_probability_chart(probabilities: Dict[int, float]) -> go.Figure:
-    """큐빗 확률 차트 생성"""
-    qubits = list(probabilities.keys())
-    probs = list(probabilities.values())
+def probabilities_key(probabilities: Dict[int, float]) -> Tuple[Tuple[int, float], ...]:
+    """확률 딕셔너리를 캐시 키용 튜플로 변환 (소수점 4자리 반올림)"""
+    return tuple(sorted((q, round(p, 4)) for q, p in probabilities.items()))
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_probability_chart(probs_tuple: Tuple[Tuple[int, float], ...]) -> go.Figure:
+    """큐빗 확률 차트 생성 (캐시됨)"""
+    qubits = [q for q, _ in probs_tuple]
+    probs = np.fromiter((p for _, p in probs_tuple), dtype=np.float32, count=len(probs_tuple))
     
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
     
-    fig = go.Figure(data=[
-        go.Bar(
-            x=[f'Qubit {q}' for q in qubits],
-            y=probs,
-            marker_color=colors[:len(qubits)],
-            text=[f'{p:.3f}' for p in probs],
-            textposition='auto',
-        )
-    ])
+    bar = go.Bar(
+        x=[f'Qubit {q}' for q in qubits],
+        y=probs,
+        marker_color=colors[:len(qubits)],
+        text=np.char.mod('%.3f', probs).tolist(),
+        textposition='auto',
+    )
     
-    fig.update_layout(
+    # 레이아웃을 생성자에 직접 전달 (update_layout 검증 단계 생략)
+    fig = go.Figure(data=[bar], layout=dict(
         title='Qubit Measurement Probabilities (|1⟩ state)',
         xaxis_title='Qubits',
         yaxis_title='Probability',
         yaxis=dict(range=[0, 1]),
         height=400,
-        showlegend=False
-    )
+        showlegend=False,
+        uirevision='const'  # 업데이트 간 뷰 상태 유지 (재레이아웃 생략)
+    ))
     
     return fig
 
 
-def create_frequency_spectrum(track_info: List[Dict]) -> go.Figure:
-    """주파수 스펙트럼 차트 생성"""
-    if not track_info:
+@st.cache_resource
+def initial_probability_chart() -> go.Figure:
+    """초기 상태 |000⟩ 확률 차트 (상수이므로 프로세스당 한 번만 생성)"""
+    return create_probability_chart(probabilities_key({0: 0.0, 1: 0.0, 2: 0.0}))
+
+
+def tracks_key(track_info: List[Dict]) -> Tuple[Tuple[int, float, float, str, int], ...]:
+    """트랙 정보를 캐시 키용 튜플로 변환 (qubit_id, frequency, amplitude, gate_type, audio_length)"""
+    return tuple(
+        (track['qubit_id'], round(track['frequency'], 4),
+         round(track['amplitude'], 4), track['gate_type'], track['audio_length'])
+        for track in track_info
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def create_frequency_spectrum(tracks_tuple: Tuple[Tuple[int, float, float, str, int], ...]) -> go.Figure:
+    """주파수 스펙트럼 차트 생성 (캐시됨)"""
+    if not tracks_tuple:
         fig = go.Figure()
         fig.add_annotation(text="No active tracks", 
                           xref="paper", yref="paper",
                           x=0.5, y=0.5, showarrow=False)
         return fig
     
-    frequencies = [track['frequency'] for track in track_info]
-    amplitudes = [track['amplitude'] for track in track_info]
-    qubit_ids = [track['qubit_id'] for track in track_info]
-    gate_types = [track['gate_type'] for track in track_info]
+    qubit_ids = [track[0] for track in tracks_tuple]
+    frequencies = [track[1] for track in tracks_tuple]
+    amplitudes = [track[2] for track in tracks_tuple]
+    gate_types = [track[3] for track in tracks_tuple]
     
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
     
-    fig = go.Figure()
+    # 모든 트랙을 하나의 트레이스로 합쳐 직렬화/렌더링 비용 절감
+    sizes = np.maximum(20, np.asarray(amplitudes) * 100)
+    marker_colors = [colors[q % len(colors)] for q in qubit_ids]
+    texts = [
+        f'Qubit {q}<br>Freq: {f:.1f}Hz<br>Amp: {a:.3f}<br>Gate: {g}'
+        for q, f, a, g in zip(qubit_ids, frequencies, amplitudes, gate_types)
+    ]
     
-    for i, (freq, amp, qubit, gate) in enumerate(zip(frequencies, amplitudes, qubit_ids, gate_types)):
-        fig.add_trace(go.Scatter(
-            x=[freq],
-            y=[amp],
-            mode='markers',
-            marker=dict(
-                size=max(20, amp * 100),
-                color=colors[qubit % len(colors)],
-                opacity=0.7
-            ),
-            name=f'Qubit {qubit} ({gate})',
-            text=f'Qubit {qubit}<br>Freq: {freq:.1f}Hz<br>Amp: {amp:.3f}<br>Gate: {gate}',
-            hovertemplate='%{text}<extra></extra>'
-        ))
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=frequencies,
+        y=amplitudes,
+        mode='markers',
+        marker=dict(
+            size=sizes,
+            color=marker_colors,
+            opacity=0.7
+        ),
+        text=texts,
+        hovertemplate='%{text}<extra></extra>'
+    ))
     
     fig.update_layout(
         title='Audio Frequency Spectrum',
         xaxis_title='Frequency (Hz)',
         yaxis_title='Amplitude',
         height=400,
+        showlegend=False,
+        uirevision='const',
         xaxis=dict(range=[200, 500]),
         yaxis=dict(range=[0, 1])
     )
@@ -242,121 +312,157 @@ def create_frequency_spectrum(track_info: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_circuit_diagram_visual(circuit, gate_sequence: List[Dict]):
-    """Qiskit 회로 다이어그램 시각화"""
-    import matplotlib
-    matplotlib.use('Agg')  # GUI 없는 백엔드 사용
-    import matplotlib.pyplot as plt
-    from io import BytesIO
-    import base64
+def gate_sequence_key(gate_sequence: List[Dict]) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+    """게이트 시퀀스를 캐시 키용 튜플로 변환 ((name, qubits), ...)"""
+    return tuple((gate['name'], tuple(gate['qubits'])) for gate in gate_sequence)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_visualization_data(_synth: QuantumCircuitSynthesizer,
+                           gate_seq_key: Tuple,
+                           shots: int,
+                           track_key: Tuple) -> Dict:
+    """회로 시각화 데이터 (게이트 시퀀스/측정 횟수/트랙 구성 기준 캐시됨)"""
+    return _synth.get_circuit_visualization_data()
+
+
+def _build_circuit(gate_seq_key: Tuple[Tuple[str, Tuple[int, ...]], ...],
+                   num_qubits: int) -> QuantumCircuit:
+    """게이트 시퀀스 키로부터 양자 회로 재구성"""
+    circuit = QuantumCircuit(QuantumRegister(num_qubits, 'q'),
+                             ClassicalRegister(num_qubits, 'c'))
+    for name, qubits in gate_seq_key:
+        getattr(circuit, name)(*qubits)
+    return circuit
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_circuit_png(gate_seq_key: Tuple[Tuple[str, Tuple[int, ...]], ...],
+                       num_qubits: int) -> Optional[str]:
+    """Qiskit 회로 다이어그램을 PNG(Base64)로 렌더링 (게이트 시퀀스 기준 캐시됨)"""
+    if not gate_seq_key:
+        return None
     
-    if not gate_sequence:
-        return None, "Empty circuit"
+    # 캐시 키로부터 회로 재구성
+    circuit = _build_circuit(gate_seq_key, num_qubits)
     
     try:
         # matplotlib 설정
         plt.style.use('default')
         
         # 회로 크기에 따라 figure 크기 조정
-        num_gates = len(gate_sequence)
+        num_gates = len(gate_seq_key)
         fig_width = max(8, min(16, 2 + num_gates * 1.5))
         fig_height = max(4, circuit.num_qubits * 1.5)
         
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        
-        # 회로 그리기 (다양한 스타일 시도)
-        try:
-            # IQP 스타일로 시도
-            circuit.draw(output='mpl', ax=ax, style='iqp')
-        except:
-            try:
-                # 기본 스타일로 시도
-                circuit.draw(output='mpl', ax=ax)
-            except:
-                # 텍스트 출력으로 대체
-                ax.text(0.5, 0.5, str(circuit), 
-                       horizontalalignment='center',
-                       verticalalignment='center',
-                       transform=ax.transAxes,
-                       fontfamily='monospace',
-                       fontsize=10)
-                ax.set_xlim(0, 1)
-                ax.set_ylim(0, 1)
-                ax.axis('off')
-        
-        # 제목 설정
-        ax.set_title('🔬 Quantum Circuit Diagram', fontsize=14, fontweight='bold', pad=20)
-        
-        # 레이아웃 조정
-        plt.tight_layout()
-        
-        # 이미지를 바이트로 변환
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=120, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        
-        # Base64 인코딩
-        img_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close(fig)
-        
-        # 텍스트 다이어그램도 생성
-        text_diagram = create_circuit_diagram_text(gate_sequence, circuit)
-        
-        return img_base64, text_diagram
+        # 공유 Figure는 세션 스레드 간 동시 접근을 막기 위해 잠금 후 사용
+        with _CIRCUIT_FIG_LOCK:
+            return _draw_circuit_png(circuit, fig_width, fig_height)
         
     except Exception as e:
-        # 오류 발생 시 텍스트 다이어그램만 반환
-        text_diagram = create_circuit_diagram_text(gate_sequence, circuit)
-        return None, text_diagram
+        return None
+
+
+def _draw_circuit_png(circuit: QuantumCircuit, fig_width: float, fig_height: float) -> str:
+    """공유 Figure에 회로를 그려 Base64 PNG로 반환"""
+    fig = _CIRCUIT_FIG
+    fig.clf()
+    fig.set_size_inches(fig_width, fig_height)
+    ax = fig.add_subplot(111)
+    
+    # 회로 그리기 (미리 확인된 스타일 사용)
+    try:
+        circuit.draw(output='mpl', ax=ax, style=_CIRCUIT_STYLE)
+    except ImportError:
+        # mpl 드로어 의존성이 없으면 텍스트 출력으로 대체
+        ax.text(0.5, 0.5, str(circuit), 
+               horizontalalignment='center',
+               verticalalignment='center',
+               transform=ax.transAxes,
+               fontfamily='monospace',
+               fontsize=10)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+    
+    # 제목 설정
+    ax.set_title('🔬 Quantum Circuit Diagram', fontsize=14, fontweight='bold', pad=20)
+    
+    # 레이아웃 조정
+    fig.tight_layout()
+    
+    # 이미지를 바이트로 변환 (dpi=90, bbox 계산 생략으로 savefig 비용 절감)
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=90, bbox_inches=None, 
+               facecolor='white', edgecolor='none')
+    buffer.seek(0)
+    
+    # Base64 인코딩
+    return base64.b64encode(buffer.getvalue()).decode()
 
 
-def create_circuit_diagram_text(gate_sequence: List[Dict], circuit=None) -> str:
-    """텍스트 기반 회로 다이어그램 생성"""
-    if not gate_sequence:
+# 게이트별 단계 설명 템플릿 (모듈 로드 시 한 번만 구성)
+_GATE_TMPL = {
+    'H': "Step {step:2d}: 🌊 H gate on qubit {q0} (Hadamard - Superposition)",
+    'X': "Step {step:2d}: ⚡ X gate on qubit {q0} (Pauli-X - Bit Flip)",
+    'CX': "Step {step:2d}: 🔗 CNOT gate (control: Q{q0} → target: Q{q1}) (Entanglement)",
+}
+_GATE_TMPL_DEFAULT = "Step {step:2d}: 🎛️ {name} gate on qubits {qs}"
+
+
+def _format_gate_steps(gate_seq_key: Tuple[Tuple[str, Tuple[int, ...]], ...]) -> List[str]:
+    """게이트 시퀀스를 단계별 설명 문자열 리스트로 변환"""
+    lines = []
+    for i, (name, qubits) in enumerate(gate_seq_key):
+        gate_name = name.upper()
+        template = _GATE_TMPL.get(gate_name, _GATE_TMPL_DEFAULT)
+        lines.append(template.format(
+            step=i + 1,
+            q0=qubits[0] if qubits else None,
+            q1=qubits[1] if len(qubits) > 1 else None,
+            name=gate_name,
+            qs=list(qubits)
+        ))
+    return lines
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_circuit_diagram_text(gate_seq_key: Tuple[Tuple[str, Tuple[int, ...]], ...],
+                                num_qubits: int) -> str:
+    """텍스트 기반 회로 다이어그램 생성 (게이트 시퀀스 기준 캐시됨)"""
+    if not gate_seq_key:
         return "Empty circuit"
     
+    gate_lines = _format_gate_steps(gate_seq_key)
+    
     # Qiskit 네이티브 텍스트 다이어그램 시도
-    if circuit is not None:
-        try:
-            qiskit_text = circuit.draw('text')
-            
-            # 추가 정보와 함께 반환
-            info_lines = [
-                "🔬 Quantum Circuit Diagram",
-                "=" * 60,
-                "",
-                str(qiskit_text),
-                "",
-                "📋 Gate Sequence:",
-                "-" * 40
-            ]
-            
-            for i, gate in enumerate(gate_sequence):
-                gate_name = gate['name'].upper()
-                qubits = gate['qubits']
-                
-                if gate_name == 'H':
-                    info_lines.append(f"Step {i+1:2d}: 🌊 H gate on qubit {qubits[0]} (Hadamard - Superposition)")
-                elif gate_name == 'X':
-                    info_lines.append(f"Step {i+1:2d}: ⚡ X gate on qubit {qubits[0]} (Pauli-X - Bit Flip)")
-                elif gate_name == 'CX':
-                    info_lines.append(f"Step {i+1:2d}: 🔗 CNOT gate (control: Q{qubits[0]} → target: Q{qubits[1]}) (Entanglement)")
-                else:
-                    info_lines.append(f"Step {i+1:2d}: 🎛️ {gate_name} gate on qubits {qubits}")
-            
-            info_lines.extend([
-                "",
-                "=" * 60,
-                f"Total gates: {len(gate_sequence)}",
-                f"Circuit depth: {circuit.depth() if hasattr(circuit, 'depth') else len(gate_sequence)}"
-            ])
-            
-            return "\n".join(info_lines)
-            
-        except Exception as e:
-            # Qiskit 텍스트 다이어그램 실패 시 폴백
-            pass
+    try:
+        circuit = _build_circuit(gate_seq_key, num_qubits)
+        qiskit_text = circuit.draw('text')
+        
+        # 추가 정보와 함께 반환
+        info_lines = [
+            "🔬 Quantum Circuit Diagram",
+            "=" * 60,
+            "",
+            str(qiskit_text),
+            "",
+            "📋 Gate Sequence:",
+            "-" * 40
+        ]
+        info_lines.extend(gate_lines)
+        info_lines.extend([
+            "",
+            "=" * 60,
+            f"Total gates: {len(gate_seq_key)}",
+            f"Circuit depth: {circuit.depth()}"
+        ])
+        
+        return "\n".join(info_lines)
+        
+    except Exception as e:
+        # Qiskit 텍스트 다이어그램 실패 시 폴백
+        pass
     
     # 폴백: 기본 텍스트 다이어그램
     diagram_lines = [
@@ -364,129 +470,66 @@ def create_circuit_diagram_text(gate_sequence: List[Dict], circuit=None) -> str:
         "=" * 60,
         ""
     ]
-    
-    for i, gate in enumerate(gate_sequence):
-        gate_name = gate['name'].upper()
-        qubits = gate['qubits']
-        
-        if gate_name == 'H':
-            diagram_lines.append(f"Step {i+1:2d}: 🌊 H gate on qubit {qubits[0]} (Hadamard - Superposition)")
-        elif gate_name == 'X':
-            diagram_lines.append(f"Step {i+1:2d}: ⚡ X gate on qubit {qubits[0]} (Pauli-X - Bit Flip)")
-        elif gate_name == 'CX':
-            diagram_lines.append(f"Step {i+1:2d}: 🔗 CNOT gate (control: Q{qubits[0]} → target: Q{qubits[1]}) (Entanglement)")
-        else:
-            diagram_lines.append(f"Step {i+1:2d}: 🎛️ {gate_name} gate on qubits {qubits}")
-    
+    diagram_lines.extend(gate_lines)
     diagram_lines.extend([
         "",
         "=" * 60,
-        f"Total gates: {len(gate_sequence)}",
-        f"Circuit depth: {max([len(gate_sequence), 1])}"
+        f"Total gates: {len(gate_seq_key)}",
+        f"Circuit depth: {max([len(gate_seq_key), 1])}"
     ])
     
     return "\n".join(diagram_lines)
 
 
-def create_audio_player(audio_base64: str) -> str:
-    """HTML 오디오 플레이어 생성"""
-    audio_html = f"""
-    <audio controls class="audio-player">
-        <source src="data:audio/wav;base64,{audio_base64}" type="audio/wav">
-        Your browser does not support the audio element.
-    </audio>
-    """
-    return audio_html
+@st.cache_data(show_spinner=False, max_entries=64)
+def build_track_dataframe(track_info_tuple: Tuple[Tuple[Tuple[str, Any], ...], ...]) -> pd.DataFrame:
+    """활성 트랙 표시용 DataFrame 생성 (트랙 정보 기준 캐시됨)"""
+    track_df = pd.DataFrame([dict(items) for items in track_info_tuple])
+    if track_df.empty:
+        return track_df
+    
+    display_df = track_df[['qubit_id', 'frequency', 'probability', 'amplitude', 'gate_type']].copy()
+    display_df.columns = ['큐빗', '주파수(Hz)', '확률', '진폭', '게이트']
+    display_df['주파수(Hz)'] = display_df['주파수(Hz)'].round(1)
+    display_df[['확률', '진폭']] = display_df[['확률', '진폭']].round(3)
+    return display_df
 
 
-def main():
-    """메인 애플리케이션"""
-    
-    # 헤더
-    st.markdown('''
-    <div class="main-header">
-        <h1>🎵 Quantum Circuit Synthesizer</h1>
-    </div>
-    ''', unsafe_allow_html=True)
-    st.markdown("**IBM Qiskit을 활용한 교육용 양자 회로 음악 변환기**")
-    st.markdown("---")
-    
-    # 신디사이저 초기화
-    if 'synthesizer' not in st.session_state:
-        st.session_state.synthesizer = initialize_synthesizer()
-        st.session_state.last_audio = None
-        st.session_state.synthesis_count = 0
-    
-    synth = st.session_state.synthesizer
+@st.cache_data(max_entries=16, show_spinner="오디오 생성 중...")
+def synthesize_audio(_synth: QuantumCircuitSynthesizer,
+                     gate_seq_key: Tuple,
+                     track_key: Tuple,
+                     master_volume: float,
+                     shots: int) -> bytes:
+    """
+    현재 트랙을 한 번만 믹싱하여 WAV 바이트 반환
     
-    # 사이드바 - 설정 및 제어
-    with st.sidebar:
-        st.markdown('<h2 class="section-header">⚙️ 제어판</h2>', unsafe_allow_html=True)
-        
-        # 회로 초기화
-        if st.button("🔄 회로 초기화 → |000⟩", use_container_width=True):
-            synth.reset_circuit()
-            st.session_state.last_audio = None
-            st.session_state.synthesis_count = 0
-            st.rerun()
-        
-        st.markdown("---")
-        
-        # 데모 회로 로드
-        st.markdown("### 📚 데모 회로")
-        demo_options = {
-            "superposition": "중첩 상태",
-            "mixed_states": "혼합 상태", 
-            "entanglement": "얽힘 상태"
-        }
-        
-        selected_demo = st.selectbox(
-            "데모 선택:",
-            options=list(demo_options.keys()),
-            format_func=lambda x: demo_options[x]
-        )
-        
-        if st.button("📥 데모 로드", use_container_width=True):
-            result = synth.load_demo_circuit(selected_demo)
-            if result['success']:
-                st.session_state.synthesis_count += 1
-                st.success(f"데모 '{demo_options[selected_demo]}' 로드됨!")
-                st.rerun()
-            else:
-                st.error(f"데모 로드 실패: {result['error']}")
-        
-        st.markdown("---")
-        
-        # 설정
-        st.markdown("### ⚙️ 오디오 설정")
-        
-        # 마스터 볼륨
-        master_volume = st.slider(
-            "마스터 볼륨",
-            min_value=0.0,
-            max_value=1.0,
-            value=synth.config.master_volume,
-            step=0.1
-        )
-        synth.config.master_volume = master_volume
-        
-        # 지속 시간
-        duration = st.slider(
-            "음표 지속 시간 (초)",
-            min_value=0.5,
-            max_value=5.0,
-            value=synth.config.default_duration,
-            step=0.5
-        )
-        synth.config.default_duration = duration
-        
-        # 측정 횟수
-        shots = st.selectbox(
-            "측정 횟수",
-            options=[256, 512, 1024, 2048, 4096],
-            index=2
-        )
-        synth.config.measurement_shots = shots
+    게이트 시퀀스, 트랙 구성(실제 트랙 길이 포함), 볼륨/측정 횟수가 같으면 캐시된 결과를 사용한다.
+    (설정의 지속 시간은 다음 합성부터 반영되므로 키에 넣지 않고 트랙 길이로 구분)
+    """
+    # 신디사이저의 믹싱 버퍼 재사용 (재생 길이가 바뀌면 신디사이저가 재할당)
+    mixed_audio = _synth.get_mixed_audio()
+    return _synth.audio_generator.to_wav_bytes(mixed_audio)
+
+
+def apply_gate(gate_fn, *qubits):
+    """게이트 적용 버튼 콜백 (패널 재실행 전에 회로 상태 갱신)"""
+    result = gate_fn(*qubits)
+    if result.success:
+        st.session_state.synthesis_count += 1
+
+
+@st.fragment
+def render_main_panel(synth: QuantumCircuitSynthesizer):
+    """게이트 제어/시각화/오디오 출력 3컬럼 패널 (프래그먼트 단위로 재실행)"""
+    # 현재 상태 가져오기 (컬럼 간 공유, 회로/트랙이 같으면 캐시 사용)
+    gate_seq_key = gate_sequence_key(synth.quantum_engine.get_gate_sequence())
+    viz_data = get_visualization_data(
+        synth,
+        gate_seq_key,
+        synth.config.measurement_shots,
+        tracks_key(synth.get_track_info())
+    )
     
     # 메인 3컬럼 레이아웃
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -500,7 +543,6 @@ def main():
         st.markdown("### 🔄 회로 상태")
         
         # 현재 상태 확인
-        viz_data = synth.get_circuit_visualization_data()
         current_probs = viz_data['qubit_probabilities']
         is_initial_state = all(prob == 0.0 for prob in current_probs.values())
         
@@ -528,67 +570,45 @@ def main():
             ("Qubit 2", "Harmony", "440Hz (A4)", "#45B7D1")
         ]
         
-        for qubit, instrument, freq, color in qubit_info:
-            st.markdown(f"""
-            <div class="qubit-info" style="border-left-color: {color};">
-                <strong>{qubit}</strong>: {instrument}<br>
-                <small>{freq}</small>
-            </div>
-            """, unsafe_allow_html=True)
+        # 하나의 HTML 블록으로 출력 (요소 수 절감)
+        qubit_info_html = "\n".join(
+            f'<div class="qubit-info" style="border-left-color: {color};">'
+            f'<strong>{qubit}</strong>: {instrument}<br><small>{freq}</small></div>'
+            for qubit, instrument, freq, color in qubit_info
+        )
+        st.markdown(qubit_info_html, unsafe_allow_html=True)
         
         st.markdown("---")
         
+        qubit_options = list(range(synth.config.num_qubits))
+        
         # 하다마드 게이트
         st.markdown("### 🌊 하다마드 게이트 (중첩)")
         st.markdown("*효과: 2개 주파수 화음*")
         
-        h_col1, h_col2, h_col3 = st.columns(3)
-        with h_col1:
-            if st.button("H → Q0", key="h0", use_container_width=True):
-                result = synth.add_hadamard_gate(0)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
-        
-        with h_col2:
-            if st.button("H → Q1", key="h1", use_container_width=True):
-                result = synth.add_hadamard_gate(1)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
-        
-        with h_col3:
-            if st.button("H → Q2", key="h2", use_container_width=True):
-                result = synth.add_hadamard_gate(2)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
+        h_qubit = st.radio(
+            "H 대상 큐빗",
+            options=qubit_options,
+            format_func=lambda q: f"Q{q}",
+            horizontal=True,
+            key="h_qubit"
+        )
+        st.button("H 게이트 적용", key="apply_h", use_container_width=True,
+                  on_click=apply_gate, args=(synth.add_hadamard_gate, h_qubit))
         
         # Pauli-X 게이트
         st.markdown("### ⚡ Pauli-X 게이트 (비트 플립)")
         st.markdown("*효과: ON/OFF 토글 + 부스트*")
         
-        x_col1, x_col2, x_col3 = st.columns(3)
-        with x_col1:
-            if st.button("X → Q0", key="x0", use_container_width=True):
-                result = synth.add_pauli_x_gate(0)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
-        
-        with x_col2:
-            if st.button("X → Q1", key="x1", use_container_width=True):
-                result = synth.add_pauli_x_gate(1)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
-        
-        with x_col3:
-            if st.button("X → Q2", key="x2", use_container_width=True):
-                result = synth.add_pauli_x_gate(2)
-                if result['success']:
-                    st.session_state.synthesis_count += 1
-                    st.rerun()
+        x_qubit = st.radio(
+            "X 대상 큐빗",
+            options=qubit_options,
+            format_func=lambda q: f"Q{q}",
+            horizontal=True,
+            key="x_qubit"
+        )
+        st.button("X 게이트 적용", key="apply_x", use_container_width=True,
+                  on_click=apply_gate, args=(synth.add_pauli_x_gate, x_qubit))
         
         # CNOT 게이트
         st.markdown("### 🔗 CNOT 게이트 (얽힘)")
@@ -603,24 +623,21 @@ def main():
             ("Q2 → Q1", 2, 1)
         ]
         
-        cnot_col1, cnot_col2 = st.columns(2)
-        for i, (label, control, target) in enumerate(cnot_options):
-            col = cnot_col1 if i % 2 == 0 else cnot_col2
-            with col:
-                if st.button(label, key=f"cnot_{control}_{target}", use_container_width=True):
-                    result = synth.add_cnot_gate(control, target)
-                    if result['success']:
-                        st.session_state.synthesis_count += 1
-                        st.rerun()
+        cnot_choice = st.selectbox(
+            "제어 → 타겟",
+            options=cnot_options,
+            format_func=lambda option: option[0],
+            key="cnot_choice"
+        )
+        _, control, target = cnot_choice
+        st.button("CNOT 게이트 적용", key="apply_cnot", use_container_width=True,
+                  on_click=apply_gate, args=(synth.add_cnot_gate, control, target))
     
     # 가운데 컬럼: 시각화
     with col2:
         st.markdown('<h2 class="section-header">📊 양자 상태 시각화</h2>', 
                    unsafe_allow_html=True)
         
-        # 현재 상태 가져오기
-        viz_data = synth.get_circuit_visualization_data()
-        
         # 큐빗 확률 차트
         current_probs = viz_data['qubit_probabilities']
         is_initial_state = all(prob == 0.0 for prob in current_probs.values())
@@ -631,8 +648,8 @@ def main():
             st.info("🔵 모든 큐빗이 |0⟩ 상태 (확률 100%)")
             
             # 초기 상태 시각화
-            initial_chart = create_probability_chart({0: 0.0, 1: 0.0, 2: 0.0})
-            st.plotly_chart(initial_chart, use_container_width=True)
+            initial_chart = initial_probability_chart()
+            st.plotly_chart(initial_chart, use_container_width=True, config=PLOTLY_CHART_CONFIG)
             
             st.markdown("""
             **초기 상태 설명:**
@@ -643,8 +660,8 @@ def main():
             """)
         else:
             st.markdown("### 📊 큐빗 |1⟩ 상태 확률")
-            prob_chart = create_probability_chart(current_probs)
-            st.plotly_chart(prob_chart, use_container_width=True)
+            prob_chart = create_probability_chart(probabilities_key(current_probs))
+            st.plotly_chart(prob_chart, use_container_width=True, config=PLOTLY_CHART_CONFIG)
             
             # 상태 해석
             total_prob = sum(current_probs.values())
@@ -678,12 +695,20 @@ def main():
         
         if viz_data['gate_sequence']:
             # 게이트가 적용된 회로
-            # 시각적 다이어그램 시도
-            img_base64, text_diagram = create_circuit_diagram_visual(
-                synth.quantum_engine.circuit, 
-                viz_data['gate_sequence']
+            text_diagram = create_circuit_diagram_text(
+                gate_seq_key,
+                synth.quantum_engine.num_qubits
             )
             
+            # 시각적 다이어그램은 요청 시에만 렌더링 (matplotlib 비용이 큼)
+            if st.toggle("🔬 시각적 다이어그램 보기", value=False, key="show_circuit_visual"):
+                img_base64 = render_circuit_png(
+                    gate_seq_key,
+                    synth.quantum_engine.num_qubits
+                )
+            else:
+                img_base64 = None
+            
             if img_base64:
                 # 시각적 다이어그램 표시
                 st.markdown(
@@ -695,7 +720,7 @@ def main():
                 with st.expander("📝 텍스트 다이어그램 보기"):
                     st.code(text_diagram, language=None)
             else:
-                # 시각적 다이어그램 실패 시 텍스트만 표시
+                # 시각적 다이어그램 미사용/실패 시 텍스트만 표시
                 st.code(text_diagram, language=None)
         else:
             # 초기 상태 (게이트 없음)
@@ -728,22 +753,25 @@ c: 3/═════
         st.markdown('<h2 class="section-header">🎵 오디오 출력</h2>', 
                    unsafe_allow_html=True)
         
+        track_info = viz_data['track_info']
+        
         # 오디오 생성 및 재생
         if st.session_state.synthesis_count > 0:
             try:
-                # 오디오 생성
-                with st.spinner("오디오 생성 중..."):
-                    mixed_audio = synth.get_mixed_audio()
-                    audio_base64 = synth.get_audio_base64()
-                    st.session_state.last_audio = audio_base64
+                # 오디오 생성 (게이트/트랙/설정이 같으면 캐시된 결과 사용)
+                wav_bytes = synthesize_audio(
+                    synth,
+                    gate_seq_key,
+                    tracks_key(track_info),
+                    synth.config.master_volume,
+                    synth.config.measurement_shots
+                )
                 
-                # 오디오 플레이어
+                # 오디오 플레이어 (미디어 엔드포인트로 전송 - 내용 해시 기준 중복 제거)
                 st.markdown("### 🎧 재생")
-                audio_html = create_audio_player(audio_base64)
-                st.markdown(audio_html, unsafe_allow_html=True)
+                st.audio(wav_bytes, format='audio/wav')
                 
                 # 다운로드 버튼
-                wav_bytes = synth.audio_generator.to_wav_bytes(mixed_audio)
                 st.download_button(
                     label="💾 WAV 파일 다운로드",
                     data=wav_bytes,
@@ -760,25 +788,112 @@ c: 3/═════
         
         # 주파수 스펙트럼
         st.markdown("### 📈 주파수 스펙트럼")
-        track_info = synth.get_track_info()
         
         if track_info:
-            freq_chart = create_frequency_spectrum(track_info)
-            st.plotly_chart(freq_chart, use_container_width=True)
+            freq_chart = create_frequency_spectrum(tracks_key(track_info))
+            st.plotly_chart(freq_chart, use_container_width=True, config=PLOTLY_CHART_CONFIG)
             
             # 트랙 정보 테이블
             st.markdown("### 📋 활성 트랙")
-            track_df = pd.DataFrame(track_info)
-            if not track_df.empty:
-                display_df = track_df[['qubit_id', 'frequency', 'probability', 'amplitude', 'gate_type']].copy()
-                display_df.columns = ['큐빗', '주파수(Hz)', '확률', '진폭', '게이트']
-                display_df['주파수(Hz)'] = display_df['주파수(Hz)'].round(1)
-                display_df['확률'] = display_df['확률'].round(3)
-                display_df['진폭'] = display_df['진폭'].round(3)
+            display_df = build_track_dataframe(
+                tuple(tuple(sorted(track.items())) for track in track_info)
+            )
+            if not display_df.empty:
                 st.dataframe(display_df, use_container_width=True)
         
         else:
             st.info("활성 트랙이 없습니다.")
+
+
+def main():
+    """메인 애플리케이션"""
+    
+    # 헤더
+    st.markdown('''
+    <div class="main-header">
+        <h1>🎵 Quantum Circuit Synthesizer</h1>
+    </div>
+    ''', unsafe_allow_html=True)
+    st.markdown("**IBM Qiskit을 활용한 교육용 양자 회로 음악 변환기**")
+    st.markdown("---")
+    
+    # 신디사이저 초기화
+    if 'synthesizer' not in st.session_state:
+        st.session_state.synthesizer = initialize_synthesizer()
+        st.session_state.synthesis_count = 0
+    
+    synth = st.session_state.synthesizer
+    
+    # 사이드바 - 설정 및 제어
+    with st.sidebar:
+        st.markdown('<h2 class="section-header">⚙️ 제어판</h2>', unsafe_allow_html=True)
+        
+        # 회로 초기화
+        if st.button("🔄 회로 초기화 → |000⟩", use_container_width=True):
+            synth.reset_circuit()
+            st.session_state.synthesis_count = 0
+            st.rerun()
+        
+        st.markdown("---")
+        
+        # 데모 회로 로드
+        st.markdown("### 📚 데모 회로")
+        demo_options = {
+            "superposition": "중첩 상태",
+            "mixed_states": "혼합 상태", 
+            "entanglement": "얽힘 상태"
+        }
+        
+        selected_demo = st.selectbox(
+            "데모 선택:",
+            options=list(demo_options.keys()),
+            format_func=lambda x: demo_options[x]
+        )
+        
+        if st.button("📥 데모 로드", use_container_width=True):
+            result = synth.load_demo_circuit(selected_demo)
+            if result.success:
+                st.session_state.synthesis_count += 1
+                st.success(f"데모 '{demo_options[selected_demo]}' 로드됨!")
+                st.rerun()
+            else:
+                st.error(f"데모 로드 실패: {result.error}")
+        
+        st.markdown("---")
+        
+        # 설정
+        st.markdown("### ⚙️ 오디오 설정")
+        
+        # 마스터 볼륨
+        master_volume = st.slider(
+            "마스터 볼륨",
+            min_value=0.0,
+            max_value=1.0,
+            value=synth.config.master_volume,
+            step=0.1
+        )
+        synth.config.master_volume = master_volume
+        
+        # 지속 시간
+        duration = st.slider(
+            "음표 지속 시간 (초)",
+            min_value=0.5,
+            max_value=5.0,
+            value=synth.config.default_duration,
+            step=0.5
+        )
+        synth.config.default_duration = duration
+        
+        # 측정 횟수
+        shots = st.selectbox(
+            "측정 횟수",
+            options=[256, 512, 1024, 2048, 4096],
+            index=2
+        )
+        synth.config.measurement_shots = shots
+    
+    # 메인 패널 (게이트 조작 시 이 부분만 재실행)
+    render_main_panel(synth)
     
     # 하단 정보
     st.markdown("---")
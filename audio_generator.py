@@ -4,16 +4,21 @@ Audio Generation Module
 """
 
 import numpy as np
-import scipy.io.wavfile as wavfile
 from typing import List, Dict, Tuple, Optional
-import io
 import base64
+import struct
 import logging
 
+from audio_kernels import (linear_ramp, _fill_osc, _fill_chord, _fill_sync, _fill_toggle,
+                           _adsr_inplace, _to_pcm16, _mix_tracks)
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PCM 모노 WAV 헤더 크기 (RIFF + fmt + data 청크 헤더)
+WAV_HEADER_SIZE = 44
+
 
 class AudioGenerator:
     """오디오 생성 클래스"""
@@ -27,13 +32,33 @@ class AudioGenerator:
         """
         self.sample_rate = sample_rate
         self.bit_depth = 16  # 16-bit audio
+        self.dtype = np.float32  # 내부 오디오 버퍼 자료형 (16-bit 출력에는 float32로 충분)
+        
+        # 10ms 페이드 인/아웃 램프 (페이드 길이별로 모듈 수준에서 공유)
+        self._fade_samples = int(0.01 * sample_rate)
+        self._fade_in = linear_ramp(self._fade_samples, 0.0, 1.0).astype(self.dtype, copy=False)
+        self._fade_out = linear_ramp(self._fade_samples, 1.0, 0.0).astype(self.dtype, copy=False)
+        
+        # 믹싱용 트랙 스택 버퍼 (첫 믹싱 시 확장)
+        self._mix_stack = np.empty((0, 0), dtype=self.dtype)
+        
+        # WAV 헤더 템플릿 (샘플링 레이트/비트 깊이/채널 수 고정, 길이 필드만 갱신)
+        self._wav_header = bytearray(WAV_HEADER_SIZE)
+        struct.pack_into('<4sI4s4sIHHIIHH4sI', self._wav_header, 0,
+                         b'RIFF', 36, b'WAVE',
+                         b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, self.bit_depth,
+                         b'data', 0)
+        
+        # WAV 직렬화 버퍼 (기본 2초 분량, 부족하면 확장) - PCM은 헤더 뒤에 직접 기록
+        self._alloc_wav_buffer(2 * sample_rate)
         logger.info(f"AudioGenerator initialized with sample_rate={sample_rate}Hz")
     
     def generate_sine_wave(self, 
                           frequency: float, 
                           duration: float, 
                           amplitude: float = 0.5,
-                          phase: float = 0.0) -> np.ndarray:
+                          phase: float = 0.0,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         사인파 생성
         
@@ -42,26 +67,55 @@ class AudioGenerator:
             duration: 지속 시간 (초)
             amplitude: 진폭 (0.0 ~ 1.0)
             phase: 위상 (라디안)
+            out: 결과를 기록할 재사용 버퍼 (None이면 새로 할당)
             
         Returns:
             사인파 오디오 데이터
         """
+        wave = self._output_buffer(int(self.sample_rate * duration), out)
         if frequency <= 0 or duration <= 0:
-            return np.zeros(int(self.sample_rate * duration))
-        
-        # 시간 배열 생성
-        t = np.linspace(0, duration, int(self.sample_rate * duration), False)
+            wave.fill(0.0)
+            return wave
         
-        # 사인파 생성
-        wave = amplitude * np.sin(2 * np.pi * frequency * t + phase)
+        # 출력 버퍼에 직접 사인파 기록 (점화식 오실레이터, 샘플별 sin 계산 없음)
+        _fill_osc(wave, self.sample_rate, frequency, phase, amplitude)
         
         # 페이드 인/아웃 적용 (클릭 노이즈 방지)
-        fade_samples = int(0.01 * self.sample_rate)  # 10ms 페이드
-        if len(wave) > 2 * fade_samples:
+        return self._apply_fade(wave)
+    
+    def _output_buffer(self, num_samples: int, out: Optional[np.ndarray]) -> np.ndarray:
+        """
+        출력 버퍼 반환 (out이 주어지면 앞부분 뷰, 아니면 새로 할당, 내용은 초기화하지 않음)
+        
+        Args:
+            num_samples: 샘플 수
+            out: 재사용할 버퍼 (길이가 num_samples 이상이어야 함)
+            
+        Returns:
+            self.dtype 출력 버퍼
+        """
+        if out is None:
+            return np.empty(num_samples, dtype=self.dtype)
+        if len(out) < num_samples:
+            raise ValueError("Output buffer is shorter than the requested duration")
+        return out[:num_samples]
+    
+    def _apply_fade(self, wave: np.ndarray) -> np.ndarray:
+        """
+        10ms 페이드 인/아웃을 제자리(in-place)에서 적용
+        
+        Args:
+            wave: 오디오 데이터
+            
+        Returns:
+            페이드가 적용된 오디오 데이터 (입력과 같은 배열)
+        """
+        fade_samples = self._fade_samples
+        if fade_samples > 0 and len(wave) > 2 * fade_samples:
             # 페이드 인
-            wave[:fade_samples] *= np.linspace(0, 1, fade_samples)
+            wave[:fade_samples] *= self._fade_in
             # 페이드 아웃
-            wave[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+            wave[-fade_samples:] *= self._fade_out
         
         return wave
     
@@ -69,7 +123,8 @@ class AudioGenerator:
                                base_frequency: float, 
                                duration: float,
                                amplitude: float = 0.5,
-                               harmonics: List[float] = [1.0, 1.25, 1.5]) -> np.ndarray:
+                               harmonics: List[float] = [1.0, 1.25, 1.5],
+                               out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         하모닉 화음 생성 (하다마드 게이트용)
         
@@ -78,27 +133,22 @@ class AudioGenerator:
             duration: 지속 시간 (초)
             amplitude: 전체 진폭
             harmonics: 하모닉 비율 리스트
+            out: 결과를 기록할 재사용 버퍼 (None이면 새로 할당)
             
         Returns:
             화음 오디오 데이터
         """
-        chord = np.zeros(int(self.sample_rate * duration))
+        ratios = np.asarray(harmonics, dtype=np.float64)
+        amps = amplitude / len(harmonics) * (1.0 - np.arange(len(harmonics)) * 0.1)  # 점진적 감소
         
-        for i, harmonic_ratio in enumerate(harmonics):
-            freq = base_frequency * harmonic_ratio
-            harmonic_amp = amplitude / len(harmonics) * (1.0 - i * 0.1)  # 점진적 감소
-            
-            harmonic_wave = self.generate_sine_wave(
-                frequency=freq,
-                duration=duration,
-                amplitude=harmonic_amp
-            )
-            
-            chord += harmonic_wave
+        # 배음 합성, 페이드, 피크 계산을 한 번의 패스로 수행
+        chord = self._output_buffer(int(self.sample_rate * duration), out)
+        peak = _fill_chord(chord, self.sample_rate, base_frequency, amps, ratios,
+                           self._fade_samples)
         
-        # 정규화
-        if np.max(np.abs(chord)) > 0:
-            chord = chord / np.max(np.abs(chord)) * amplitude
+        # 정규화 (제자리 연산)
+        if peak > 0:
+            chord *= amplitude / peak
         
         return chord
     
@@ -106,7 +156,8 @@ class AudioGenerator:
                             frequency: float, 
                             duration: float,
                             amplitude: float = 0.5,
-                            is_on: bool = True) -> np.ndarray:
+                            is_on: bool = True,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         토글 파형 생성 (Pauli-X 게이트용)
         
@@ -115,39 +166,25 @@ class AudioGenerator:
             duration: 지속 시간 (초)
             amplitude: 진폭
             is_on: ON/OFF 상태
+            out: 결과를 기록할 재사용 버퍼 (None이면 새로 할당)
             
         Returns:
             토글 파형 오디오 데이터
         """
         if not is_on:
-            return np.zeros(int(self.sample_rate * duration))
+            silence = self._output_buffer(int(self.sample_rate * duration), out)
+            silence.fill(0.0)
+            return silence
         
         # 더 강력하고 명확한 "부스트" 효과
-        # 1. 기본 사인파 (더 강하게)
-        base_wave = self.generate_sine_wave(frequency, duration, amplitude * 1.2)
-        
-        # 2. 옥타브 배음 (더 강하게)
-        octave_wave = self.generate_sine_wave(frequency * 2, duration, amplitude * 0.6)
-        
-        # 3. 5도 배음 추가 (음악적 효과)
-        fifth_wave = self.generate_sine_wave(frequency * 1.5, duration, amplitude * 0.4)
-        
-        # 4. 펄스 효과 (토글 느낌)
-        samples = int(self.sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        # 빠른 펄스 모듈레이션 (8Hz)
-        pulse_mod = 0.5 + 0.5 * np.sin(2 * np.pi * 8 * t)
-        
-        # 모든 파형 합성
-        combined_wave = base_wave + octave_wave + fifth_wave
-        
-        # 펄스 모듈레이션 적용
-        toggle_wave = combined_wave * pulse_mod
+        # 1. 기본 사인파 (더 강하게) + 2. 옥타브 배음 (더 강하게) + 3. 5도 배음 (음악적 효과)
+        # + 4. 빠른 펄스 모듈레이션 (8Hz, 토글 느낌) - 페이드/피크 계산까지 한 번의 패스로 수행
+        toggle_wave = self._output_buffer(int(self.sample_rate * duration), out)
+        peak = _fill_toggle(toggle_wave, self.sample_rate, frequency, amplitude, self._fade_samples)
         
         # 정규화 및 강화
-        if np.max(np.abs(toggle_wave)) > 0:
-            toggle_wave = toggle_wave / np.max(np.abs(toggle_wave)) * amplitude * 1.5
+        if peak > 0:
+            toggle_wave *= amplitude * 1.5 / peak
         
         return toggle_wave
     
@@ -171,53 +208,43 @@ class AudioGenerator:
         if len(frequencies) != len(amplitudes):
             raise ValueError("Frequencies and amplitudes must have same length")
         
-        harmony = np.zeros(int(self.sample_rate * duration))
-        
-        # 기본 하모니 생성
-        for freq, amp in zip(frequencies, amplitudes):
-            if amp > 0.01:  # 최소 임계값
-                wave = self.generate_sine_wave(freq, duration, amp)
-                harmony += wave
+        # 최소 임계값 이상인 성분만 합성
+        freqs = np.asarray(frequencies, dtype=np.float64)
+        amps = np.asarray(amplitudes, dtype=np.float64)
+        active = amps > 0.01
         
-        # 동기화 효과 (비트 주파수 추가)
+        # 동기화 효과 (비트 주파수)
+        beat_freq = 0.0
         if sync_factor > 0 and len(frequencies) >= 2:
             beat_freq = abs(frequencies[0] - frequencies[1]) * sync_factor
-            if beat_freq > 0:
-                t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-                beat_envelope = 0.5 * (1 + np.cos(2 * np.pi * beat_freq * t))
-                harmony *= beat_envelope
         
-        # 정규화
-        if np.max(np.abs(harmony)) > 0:
-            harmony = harmony / np.max(np.abs(harmony)) * max(amplitudes)
+        # 하모니 합성, 비트 엔벨로프, 페이드, 피크 계산을 한 번의 패스로 수행
+        harmony = np.empty(int(self.sample_rate * duration), dtype=self.dtype)
+        peak = _fill_sync(harmony, self.sample_rate, freqs[active], amps[active],
+                          beat_freq, self._fade_samples)
+        
+        # 정규화 (제자리 연산)
+        if peak > 0:
+            harmony *= max(amplitudes) / peak
         
         return harmony
     
-    def mix_audio_tracks(self, tracks: List[np.ndarray], weights: List[float] = None) -> np.ndarray:
+    def mix_audio_tracks(self, tracks, weights: List[float] = None,
+                         out: Optional[np.ndarray] = None, level: float = 0.8) -> np.ndarray:
         """
         여러 오디오 트랙 믹싱
         
         Args:
-            tracks: 오디오 트랙 리스트
+            tracks: 오디오 트랙 리스트 또는 (트랙 수, 샘플 수) 행렬 (행렬이면 복사 없이 그대로 사용)
             weights: 각 트랙의 가중치 (None이면 균등)
+            out: 결과를 기록할 재사용 버퍼 (길이가 충분하면 앞부분 뷰를 반환)
+            level: 정규화 후 최대 절댓값
             
         Returns:
             믹싱된 오디오 데이터
         """
-        if not tracks:
-            return np.array([])
-        
-        # 모든 트랙을 같은 길이로 맞춤
-        max_length = max(len(track) for track in tracks)
-        normalized_tracks = []
-        
-        for track in tracks:
-            if len(track) < max_length:
-                # 제로 패딩
-                padded_track = np.pad(track, (0, max_length - len(track)), 'constant')
-                normalized_tracks.append(padded_track)
-            else:
-                normalized_tracks.append(track[:max_length])
+        if len(tracks) == 0:
+            return np.array([], dtype=self.dtype)
         
         # 가중치 설정
         if weights is None:
@@ -225,17 +252,50 @@ class AudioGenerator:
         elif len(weights) != len(tracks):
             raise ValueError("Weights must have same length as tracks")
         
-        # 믹싱
-        mixed = np.zeros(max_length)
-        for track, weight in zip(normalized_tracks, weights):
-            mixed += track * weight
+        if isinstance(tracks, np.ndarray) and tracks.ndim == 2:
+            stack = tracks
+            max_length = tracks.shape[1]
+        else:
+            # 모든 트랙을 (트랙 수, 최대 길이) 스택에 복사 (패딩 배열 없이 짧은 트랙만 뒤를 0으로 채움)
+            max_length = max(len(track) for track in tracks)
+            stack = self._mix_stack_buffer(len(tracks), max_length)
+            for row, track in zip(stack, tracks):
+                np.copyto(row[:len(track)], track)
+                if len(track) < max_length:
+                    row[len(track):].fill(0.0)
+        
+        # 믹싱 (가중합을 한 번의 패스로 계산, 재사용 버퍼가 주어지면 그 위에 기록)
+        if out is not None and len(out) >= max_length:
+            mixed = out[:max_length]
+        else:
+            mixed = np.empty(max_length, dtype=self.dtype)
+        _mix_tracks(stack, np.asarray(weights, dtype=np.float64), mixed)
         
         # 정규화 (클리핑 방지)
-        if np.max(np.abs(mixed)) > 0:
-            mixed = mixed / np.max(np.abs(mixed)) * 0.8  # 80% 최대값으로 제한
+        peak = np.abs(mixed).max()
+        if peak > 0:
+            np.multiply(mixed, level / peak, out=mixed)  # 기본 80% 최대값으로 제한
         
         return mixed
     
+    def _mix_stack_buffer(self, num_tracks: int, num_samples: int) -> np.ndarray:
+        """
+        믹싱용 트랙 스택 버퍼 반환 (재사용, 부족하면 확장)
+        
+        Args:
+            num_tracks: 트랙 수
+            num_samples: 트랙당 샘플 수
+            
+        Returns:
+            (num_tracks, num_samples) self.dtype 버퍼 뷰
+        """
+        stack = self._mix_stack
+        if stack.shape[0] < num_tracks or stack.shape[1] < num_samples:
+            stack = np.empty((max(num_tracks, stack.shape[0]), max(num_samples, stack.shape[1])),
+                             dtype=self.dtype)
+            self._mix_stack = stack
+        return stack[:num_tracks, :num_samples]
+    
     def apply_envelope(self, audio: np.ndarray, 
                       attack: float = 0.1, 
                       decay: float = 0.1, 
@@ -252,40 +312,27 @@ class AudioGenerator:
             release: 릴리즈 시간 (초)
             
         Returns:
-            엔벨로프가 적용된 오디오 데이터
+            엔벨로프가 적용된 오디오 데이터 (입력과 같은 배열, 제자리 수정)
         """
         if len(audio) == 0:
             return audio
         
-        duration = len(audio) / self.sample_rate
-        envelope = np.ones(len(audio))
-        
         # 샘플 수 계산
+        num_samples = len(audio)
         attack_samples = int(attack * self.sample_rate)
         decay_samples = int(decay * self.sample_rate)
         release_samples = int(release * self.sample_rate)
         
-        # 어택 구간
-        if attack_samples > 0 and attack_samples < len(audio):
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        
-        # 디케이 구간
-        decay_start = attack_samples
-        decay_end = min(decay_start + decay_samples, len(audio))
-        if decay_end > decay_start:
-            envelope[decay_start:decay_end] = np.linspace(1, sustain, decay_end - decay_start)
-        
-        # 서스테인 구간 (중간 부분)
-        sustain_start = decay_end
-        sustain_end = max(0, len(audio) - release_samples)
-        if sustain_end > sustain_start:
-            envelope[sustain_start:sustain_end] = sustain
-        
-        # 릴리즈 구간
-        if release_samples > 0 and sustain_end < len(audio):
-            envelope[sustain_end:] = np.linspace(sustain, 0, len(audio) - sustain_end)
+        # 구간 경계 (어택은 버퍼보다 짧을 때만 적용, 릴리즈가 겹치는 구간보다 우선)
+        attack_n = attack_samples if 0 < attack_samples < num_samples else 0
+        decay_end = min(attack_samples + decay_samples, num_samples)
+        sustain_end = max(0, num_samples - release_samples)
+        release_start = sustain_end if release_samples > 0 else num_samples
         
-        return audio * envelope
+        # 엔벨로프 배열 없이 한 번의 패스로 제자리 적용
+        _adsr_inplace(audio, attack_n, attack_samples, decay_end, sustain_end,
+                      release_start, sustain)
+        return audio
     
     def to_wav_bytes(self, audio: np.ndarray) -> bytes:
         """
@@ -297,15 +344,7 @@ class AudioGenerator:
         Returns:
             WAV 형식 바이트 데이터
         """
-        # 16-bit 정수로 변환
-        audio_int16 = (audio * 32767).astype(np.int16)
-        
-        # 메모리 버퍼에 WAV 파일 작성
-        buffer = io.BytesIO()
-        wavfile.write(buffer, self.sample_rate, audio_int16)
-        buffer.seek(0)
-        
-        return buffer.getvalue()
+        return bytes(self._write_wav(audio))
     
     def save_wav_file(self, audio: np.ndarray, filename: str):
         """
@@ -315,13 +354,55 @@ class AudioGenerator:
             audio: 오디오 데이터
             filename: 저장할 파일명
         """
-        # 16-bit 정수로 변환
-        audio_int16 = (audio * 32767).astype(np.int16)
-        
         # WAV 파일 저장
-        wavfile.write(filename, self.sample_rate, audio_int16)
+        with open(filename, 'wb') as f:
+            f.write(self._write_wav(audio))
         logger.info(f"Audio saved to {filename}")
     
+    def _alloc_wav_buffer(self, num_samples: int):
+        """
+        WAV 직렬화 버퍼 할당 (헤더 템플릿 복사 + PCM 영역을 가리키는 int16 뷰)
+        
+        Args:
+            num_samples: PCM 영역에 담을 수 있는 샘플 수
+        """
+        self._wav_buf = bytearray(WAV_HEADER_SIZE + 2 * num_samples)
+        self._wav_buf[:WAV_HEADER_SIZE] = self._wav_header
+        self._pcm_buf = np.frombuffer(self._wav_buf, dtype='<i2', offset=WAV_HEADER_SIZE)
+    
+    def _to_pcm(self, audio: np.ndarray) -> np.ndarray:
+        """
+        오디오 데이터를 재사용 버퍼에 16-bit PCM으로 변환
+        
+        Args:
+            audio: 오디오 데이터
+            
+        Returns:
+            int16 PCM 데이터 (내부 버퍼의 뷰 - 다음 변환 시 덮어씀)
+        """
+        audio = np.asarray(audio, dtype=self.dtype)
+        if len(audio) > len(self._pcm_buf):
+            self._alloc_wav_buffer(len(audio))
+        pcm = self._pcm_buf[:len(audio)]
+        _to_pcm16(audio, pcm)
+        return pcm
+    
+    def _write_wav(self, audio: np.ndarray) -> memoryview:
+        """
+        오디오 데이터를 내부 버퍼에 WAV 형식으로 직렬화 (길이 필드만 갱신)
+        
+        Args:
+            audio: 오디오 데이터
+            
+        Returns:
+            WAV 데이터 메모리뷰 (내부 버퍼 - 다음 직렬화 시 덮어씀)
+        """
+        # 16-bit 정수로 변환 (포화 변환 - 범위를 벗어난 샘플이 부호 반전되지 않음)
+        data_len = self._to_pcm(audio).nbytes
+        struct.pack_into('<I', self._wav_buf, 4, 36 + data_len)
+        struct.pack_into('<I', self._wav_buf, 40, data_len)
+        return memoryview(self._wav_buf)[:WAV_HEADER_SIZE + data_len]
+    
     def get_audio_base64(self, audio: np.ndarray) -> str:
         """
         오디오 데이터를 Base64 문자열로 변환 (웹 재생용)
@@ -332,8 +413,8 @@ class AudioGenerator:
         Returns:
             Base64 인코딩된 WAV 데이터
         """
-        wav_bytes = self.to_wav_bytes(audio)
-        return base64.b64encode(wav_bytes).decode('utf-8')
+        # 중간 bytes 객체 없이 내부 버퍼에서 바로 인코딩
+        return base64.b64encode(self._write_wav(audio)).decode('utf-8')
 
 
 class QuantumAudioMapper:
@@ -362,29 +443,32 @@ class QuantumAudioMapper:
             'cx': 'synchronized_harmony' # CNOT → 동기화 하모니
         }
     
-    def probability_to_amplitude(self, probability: float, min_threshold: float = 0.1) -> float:
+    def probability_to_amplitude(self, probability, min_threshold: float = 0.1):
         """
-        확률을 오디오 진폭으로 변환
+        확률을 오디오 진폭으로 변환 (스칼라 또는 큐빗별 확률 배열)
         
         Args:
-            probability: 측정 확률 (0.0 ~ 1.0)
+            probability: 측정 확률 (0.0 ~ 1.0) 또는 확률 배열
             min_threshold: 최소 임계값 (이하는 무음)
             
         Returns:
-            오디오 진폭 (0.0 ~ 1.0)
+            오디오 진폭 (0.0 ~ 1.0) - 스칼라 입력이면 float, 배열 입력이면 같은 형태의 배열
         """
-        if probability < min_threshold:
-            return 0.0
+        probs = np.asarray(probability, dtype=np.float64)
+        
+        # 로그 스케일 적용 (작은 확률도 들리도록) - 임계값 미만은 분기 없이 마스킹
+        normalized_prob = np.maximum((probs - min_threshold) / (1.0 - min_threshold), 0.0)
+        # 제곱근으로 더 자연스러운 볼륨 곡선
+        amplitude = np.where(probs >= min_threshold, np.sqrt(normalized_prob), 0.0)
         
-        # 로그 스케일 적용 (작은 확률도 들리도록)
-        normalized_prob = (probability - min_threshold) / (1.0 - min_threshold)
-        return np.sqrt(normalized_prob)  # 제곱근으로 더 자연스러운 볼륨 곡선
+        return float(amplitude) if amplitude.ndim == 0 else amplitude
     
     def generate_qubit_audio(self, 
                            qubit_id: int, 
                            probability: float, 
                            gate_type: str,
-                           duration: float = 1.0) -> np.ndarray:
+                           duration: float = 1.0,
+                           out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         특정 큐빗의 오디오 생성
         
@@ -393,18 +477,23 @@ class QuantumAudioMapper:
             probability: 측정 확률
             gate_type: 적용된 게이트 타입
             duration: 지속 시간 (초)
+            out: 결과를 기록할 버퍼 (None이면 새로 할당)
             
         Returns:
-            생성된 오디오 데이터
+            생성된 오디오 데이터 (out이 주어지면 그 앞부분 뷰, 아니면 새 배열)
         """
+        num_samples = int(self.audio_gen.sample_rate * duration)
+        out = self.audio_gen._output_buffer(num_samples, out)
         if qubit_id not in self.qubit_frequencies:
-            return np.zeros(int(self.audio_gen.sample_rate * duration))
+            out.fill(0.0)
+            return out
         
         frequency = self.qubit_frequencies[qubit_id]
         amplitude = self.probability_to_amplitude(probability)
         
         if amplitude == 0.0:
-            return np.zeros(int(self.audio_gen.sample_rate * duration))
+            out.fill(0.0)
+            return out
         
         # 게이트 타입에 따른 오디오 생성
         if gate_type == 'h':
@@ -412,7 +501,8 @@ class QuantumAudioMapper:
             return self.audio_gen.generate_harmonic_chord(
                 base_frequency=frequency,
                 duration=duration,
-                amplitude=amplitude
+                amplitude=amplitude,
+                out=out
             )
         elif gate_type == 'x':
             # Pauli-X: 토글 효과
@@ -420,14 +510,16 @@ class QuantumAudioMapper:
                 frequency=frequency,
                 duration=duration,
                 amplitude=amplitude,
-                is_on=probability > 0.5
+                is_on=probability > 0.5,
+                out=out
             )
         else:
             # 기본: 사인파
             return self.audio_gen.generate_sine_wave(
                 frequency=frequency,
                 duration=duration,
-                amplitude=amplitude
+                amplitude=amplitude,
+                out=out
             )
 
 
@@ -0,0 +1,468 @@
+"""
+Audio Synthesis Kernels
+오디오 합성 커널 - Numba JIT 가속 (Numba 미설치 시 NumPy 구현으로 대체)
+"""
+
+import os
+
+# Numba 캐시 디렉토리 (앱 로컬 경로 - 재시작/재배포 시 컴파일 결과 재사용)
+os.environ.setdefault(
+    'NUMBA_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.numba_cache')
+)
+
+import math
+from functools import lru_cache
+import numpy as np
+import logging
+
+# Numba import with fallback
+try:
+    import numba
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def linear_ramp(length: int, start: float = 0.0, end: float = 1.0) -> np.ndarray:
+    """
+    선형 램프 반환 (길이/시작/끝 값별로 한 번만 생성해 공유, 읽기 전용)
+
+    Args:
+        length: 샘플 수
+        start: 시작 값
+        end: 끝 값
+
+    Returns:
+        np.linspace(start, end, length)와 같은 float32 배열
+    """
+    ramp = np.linspace(start, end, length, dtype=np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True, nogil=True)
+    def mix_sines(out, freqs, amps, phases, sr):
+        """
+        사인파 뱅크를 out 버퍼에 누적 (out[i] += Σ amp_k·sin(2π·f_k·i/sr + φ_k))
+
+        Args:
+            out: 누적할 출력 버퍼 (1차원)
+            freqs: 주파수 배열 (Hz)
+            amps: 진폭 배열
+            phases: 위상 배열 (라디안)
+            sr: 샘플링 레이트 (Hz)
+        """
+        n = out.shape[0]
+        num_sines = freqs.shape[0]
+        for i in range(n):
+            t = i / sr
+            acc = 0.0
+            for k in range(num_sines):
+                acc += amps[k] * np.sin(2.0 * np.pi * freqs[k] * t + phases[k])
+            out[i] += acc
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _fill_osc(out, sr, freq, phase, amp):
+        """
+        단일 사인파를 out 버퍼에 기록 (out[i] = amp·sin(2π·f·i/sr + φ))
+
+        샘플마다 sin을 계산하지 않고 2차 점화식 y[n] = 2cos(ω)·y[n-1] - y[n-2]로 생성
+        (주파수가 버퍼 전체에서 일정할 때만 사용).
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freq: 주파수 (Hz)
+            phase: 위상 (라디안)
+            amp: 진폭
+        """
+        w = 2.0 * math.pi * freq / sr
+        k = 2.0 * math.cos(w)
+        y1 = amp * math.sin(phase)
+        y2 = amp * math.sin(phase - w)
+        for i in range(out.shape[0]):
+            out[i] = y1
+            y = k * y1 - y2
+            y2 = y1
+            y1 = y
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _fill_chord(out, sr, f0, amps, ratios, fade_n):
+        """
+        기본 주파수의 배음 합성 + 페이드 + 최대 절댓값 계산을 한 번의 패스로 수행
+        (out[i] = g_i·Σ amp_k·sin(2π·f0·ratio_k·i/sr), g_i는 선형 페이드 인/아웃)
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            f0: 기본 주파수 (Hz)
+            amps: 배음별 진폭 배열
+            ratios: 배음 비율 배열
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        n = out.shape[0]
+        num_harmonics = ratios.shape[0]
+        w = np.empty(num_harmonics)
+        for k in range(num_harmonics):
+            w[k] = 2.0 * math.pi * f0 * ratios[k] / sr
+        if n <= 2 * fade_n:
+            fade_n = 0
+        fade_step = 1.0 / (fade_n - 1) if fade_n > 1 else 0.0
+        peak = 0.0
+        for i in range(n):
+            acc = 0.0
+            for k in range(num_harmonics):
+                acc += amps[k] * math.sin(w[k] * i)
+            if i < fade_n:
+                acc *= i * fade_step
+            elif i >= n - fade_n:
+                acc *= (n - 1 - i) * fade_step
+            out[i] = acc
+            peak = max(peak, abs(acc))
+        return peak
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _fill_sync(out, sr, freqs, amps, beat_freq, fade_n):
+        """
+        사인파 합성 + 페이드 + 비트 엔벨로프 + 최대 절댓값 계산을 한 번의 패스로 수행
+        (out[i] = g_i·b_i·Σ amp_k·sin(2π·f_k·i/sr), b_i = 0.5·(1 + cos(2π·beat·i/sr)))
+
+        각 사인 성분과 비트 코사인은 _fill_osc와 같은 2차 점화식으로 생성하므로
+        샘플마다 sin/cos를 호출하지 않는다.
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freqs: 주파수 배열 (Hz)
+            amps: 진폭 배열
+            beat_freq: 비트 주파수 (Hz, 0이면 비트 엔벨로프 없음)
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        n = out.shape[0]
+        num_sines = freqs.shape[0]
+        # 성분별 점화식 상태 (y1 = 현재 샘플, y2 = 이전 샘플, 진폭 포함)
+        coef = np.empty(num_sines)
+        y1 = np.empty(num_sines)
+        y2 = np.empty(num_sines)
+        for k in range(num_sines):
+            w = 2.0 * math.pi * freqs[k] / sr
+            coef[k] = 2.0 * math.cos(w)
+            y1[k] = 0.0
+            y2[k] = -amps[k] * math.sin(w)
+        wb = 2.0 * math.pi * beat_freq / sr
+        kb = 2.0 * math.cos(wb)
+        b1 = 1.0
+        b2 = math.cos(wb)
+        if n <= 2 * fade_n:
+            fade_n = 0
+        fade_step = 1.0 / (fade_n - 1) if fade_n > 1 else 0.0
+        peak = 0.0
+        for i in range(n):
+            acc = 0.0
+            for k in range(num_sines):
+                acc += y1[k]
+                y = coef[k] * y1[k] - y2[k]
+                y2[k] = y1[k]
+                y1[k] = y
+            if beat_freq > 0:
+                acc *= 0.5 * (1.0 + b1)
+                b = kb * b1 - b2
+                b2 = b1
+                b1 = b
+            if i < fade_n:
+                acc *= i * fade_step
+            elif i >= n - fade_n:
+                acc *= (n - 1 - i) * fade_step
+            out[i] = acc
+            peak = max(peak, abs(acc))
+        return peak
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _fill_toggle(out, sr, freq, amp, fade_n):
+        """
+        토글 파형(기본음 + 옥타브 + 5도, 8Hz 펄스) + 페이드 + 최대 절댓값을 한 번의 패스로 계산
+        (옥타브는 sin(2x) = 2·sin(x)·cos(x)로 기본음과 같은 각도에서 구함)
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freq: 기본 주파수 (Hz)
+            amp: 진폭
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        n = out.shape[0]
+        w = 2.0 * math.pi * freq / sr
+        w_fifth = 1.5 * w
+        w_pulse = 2.0 * math.pi * 8.0 / sr
+        if n <= 2 * fade_n:
+            fade_n = 0
+        fade_step = 1.0 / (fade_n - 1) if fade_n > 1 else 0.0
+        peak = 0.0
+        for i in range(n):
+            s = math.sin(w * i)
+            c = math.cos(w * i)
+            acc = amp * (1.2 * s + 0.6 * (2.0 * s * c) + 0.4 * math.sin(w_fifth * i))
+            acc *= 0.5 + 0.5 * math.sin(w_pulse * i)
+            if i < fade_n:
+                acc *= i * fade_step
+            elif i >= n - fade_n:
+                acc *= (n - 1 - i) * fade_step
+            out[i] = acc
+            peak = max(peak, abs(acc))
+        return peak
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _adsr_inplace(audio, attack_n, decay_start, decay_end, sustain_end,
+                      release_start, sustain):
+        """
+        ADSR 엔벨로프를 한 번의 패스로 audio에 제자리 적용 (별도 엔벨로프 배열 없음)
+
+        Args:
+            audio: 오디오 버퍼 (1차원, 제자리 수정)
+            attack_n: 어택 램프 길이 (샘플, 0이면 어택 없음)
+            decay_start: 디케이 구간 시작 (샘플 인덱스)
+            decay_end: 디케이 구간 끝 = 서스테인 시작 (샘플 인덱스)
+            sustain_end: 서스테인 구간 끝 (샘플 인덱스)
+            release_start: 릴리즈 시작 (샘플 인덱스, 길이 이상이면 릴리즈 없음)
+            sustain: 서스테인 레벨
+        """
+        n = audio.shape[0]
+        attack_step = 1.0 / (attack_n - 1) if attack_n > 1 else 0.0
+        decay_m = decay_end - decay_start
+        decay_step = (sustain - 1.0) / (decay_m - 1) if decay_m > 1 else 0.0
+        release_m = n - release_start
+        release_step = -sustain / (release_m - 1) if release_m > 1 else 0.0
+        for i in range(n):
+            if i >= release_start:
+                # 릴리즈 (앞 구간과 겹치면 릴리즈가 우선)
+                g = sustain + (i - release_start) * release_step
+            elif i < attack_n:
+                g = i * attack_step
+            elif decay_start <= i < decay_end:
+                g = 1.0 + (i - decay_start) * decay_step
+            elif decay_end <= i < sustain_end:
+                g = sustain
+            else:
+                g = 1.0
+            audio[i] *= g
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _to_pcm16(audio, out):
+        """
+        float 오디오를 포화(saturating) 16-bit PCM으로 변환 (스케일·클립·반올림 한 번의 패스)
+
+        Args:
+            audio: 입력 오디오 (-1.0 ~ 1.0 범위 기준)
+            out: int16 출력 버퍼 (audio와 같은 길이)
+        """
+        for i in range(audio.shape[0]):
+            v = audio[i] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[i] = np.int16(np.rint(v))
+
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _mix_tracks(stack, weights, out):
+        """
+        트랙 스택의 가중합을 out에 기록 (out[i] = Σ w_k·stack[k, i], 샘플마다 한 번만 저장)
+
+        Args:
+            stack: (트랙 수, 샘플 수) 오디오 배열
+            weights: 트랙별 가중치 배열
+            out: 출력 버퍼 (길이 = 샘플 수)
+        """
+        num_tracks = stack.shape[0]
+        for i in range(stack.shape[1]):
+            acc = 0.0
+            for k in range(num_tracks):
+                acc += weights[k] * stack[k, i]
+            out[i] = acc
+
+else:
+    def mix_sines(out, freqs, amps, phases, sr):
+        """
+        사인파 뱅크를 out 버퍼에 누적 (out[i] += Σ amp_k·sin(2π·f_k·i/sr + φ_k))
+
+        Args:
+            out: 누적할 출력 버퍼 (1차원)
+            freqs: 주파수 배열 (Hz)
+            amps: 진폭 배열
+            phases: 위상 배열 (라디안)
+            sr: 샘플링 레이트 (Hz)
+        """
+        t = np.arange(out.shape[0]) / sr
+        for freq, amp, phase in zip(freqs, amps, phases):
+            out += amp * np.sin(2 * np.pi * freq * t + phase)
+
+    def _fill_osc(out, sr, freq, phase, amp):
+        """
+        단일 사인파를 out 버퍼에 기록 (out[i] = amp·sin(2π·f·i/sr + φ))
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freq: 주파수 (Hz)
+            phase: 위상 (라디안)
+            amp: 진폭
+        """
+        np.multiply(np.arange(out.shape[0]), 2 * np.pi * freq / sr, out=out, casting='unsafe')
+        np.add(out, phase, out=out, casting='unsafe')
+        np.sin(out, out=out)
+        np.multiply(out, amp, out=out, casting='unsafe')
+
+    def _fill_chord(out, sr, f0, amps, ratios, fade_n):
+        """
+        기본 주파수의 배음 합성 + 페이드 + 최대 절댓값 계산
+        (out[i] = g_i·Σ amp_k·sin(2π·f0·ratio_k·i/sr), g_i는 선형 페이드 인/아웃)
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            f0: 기본 주파수 (Hz)
+            amps: 배음별 진폭 배열
+            ratios: 배음 비율 배열
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        out.fill(0.0)
+        mix_sines(out, f0 * np.asarray(ratios), amps, np.zeros(len(ratios)), sr)
+        if fade_n > 0 and out.shape[0] > 2 * fade_n:
+            out[:fade_n] *= linear_ramp(fade_n, 0.0, 1.0)
+            out[-fade_n:] *= linear_ramp(fade_n, 1.0, 0.0)
+        return float(np.max(np.abs(out))) if out.shape[0] else 0.0
+
+    def _fill_sync(out, sr, freqs, amps, beat_freq, fade_n):
+        """
+        사인파 합성 + 페이드 + 비트 엔벨로프 + 최대 절댓값 계산
+        (out[i] = g_i·b_i·Σ amp_k·sin(2π·f_k·i/sr), b_i = 0.5·(1 + cos(2π·beat·i/sr)))
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freqs: 주파수 배열 (Hz)
+            amps: 진폭 배열
+            beat_freq: 비트 주파수 (Hz, 0이면 비트 엔벨로프 없음)
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        out.fill(0.0)
+        mix_sines(out, freqs, amps, np.zeros(len(freqs)), sr)
+        if beat_freq > 0:
+            out *= 0.5 * (1 + np.cos(2 * np.pi * beat_freq * np.arange(out.shape[0]) / sr))
+        if fade_n > 0 and out.shape[0] > 2 * fade_n:
+            out[:fade_n] *= linear_ramp(fade_n, 0.0, 1.0)
+            out[-fade_n:] *= linear_ramp(fade_n, 1.0, 0.0)
+        return float(np.max(np.abs(out))) if out.shape[0] else 0.0
+
+    def _fill_toggle(out, sr, freq, amp, fade_n):
+        """
+        토글 파형(기본음 + 옥타브 + 5도, 8Hz 펄스) + 페이드 + 최대 절댓값 계산
+
+        Args:
+            out: 출력 버퍼 (1차원)
+            sr: 샘플링 레이트 (Hz)
+            freq: 기본 주파수 (Hz)
+            amp: 진폭
+            fade_n: 페이드 길이 (샘플, 버퍼가 2배보다 짧으면 생략)
+
+        Returns:
+            기록된 신호의 최대 절댓값 (정규화용)
+        """
+        out.fill(0.0)
+        mix_sines(out, np.array([freq, freq * 2, freq * 1.5]),
+                  np.array([amp * 1.2, amp * 0.6, amp * 0.4]), np.zeros(3), sr)
+        out *= 0.5 + 0.5 * np.sin(2 * np.pi * 8 * np.arange(out.shape[0]) / sr)
+        if fade_n > 0 and out.shape[0] > 2 * fade_n:
+            out[:fade_n] *= linear_ramp(fade_n, 0.0, 1.0)
+            out[-fade_n:] *= linear_ramp(fade_n, 1.0, 0.0)
+        return float(np.max(np.abs(out))) if out.shape[0] else 0.0
+
+    def _adsr_inplace(audio, attack_n, decay_start, decay_end, sustain_end,
+                      release_start, sustain):
+        """
+        ADSR 엔벨로프를 audio에 제자리 적용
+
+        Args:
+            audio: 오디오 버퍼 (1차원, 제자리 수정)
+            attack_n: 어택 램프 길이 (샘플, 0이면 어택 없음)
+            decay_start: 디케이 구간 시작 (샘플 인덱스)
+            decay_end: 디케이 구간 끝 = 서스테인 시작 (샘플 인덱스)
+            sustain_end: 서스테인 구간 끝 (샘플 인덱스)
+            release_start: 릴리즈 시작 (샘플 인덱스, 길이 이상이면 릴리즈 없음)
+            sustain: 서스테인 레벨
+        """
+        n = audio.shape[0]
+        # 릴리즈 구간과 겹치는 앞 구간은 잘라냄 (릴리즈가 우선)
+        end = min(attack_n, release_start)
+        audio[:end] *= linear_ramp(attack_n, 0.0, 1.0)[:end]
+        end = min(decay_end, release_start)
+        if end > decay_start:
+            audio[decay_start:end] *= linear_ramp(decay_end - decay_start, 1.0, sustain)[:end - decay_start]
+        end = min(sustain_end, release_start)
+        if end > decay_end:
+            audio[decay_end:end] *= sustain
+        if release_start < n:
+            audio[release_start:] *= linear_ramp(n - release_start, sustain, 0.0)
+
+    def _to_pcm16(audio, out):
+        """
+        float 오디오를 포화(saturating) 16-bit PCM으로 변환
+
+        Args:
+            audio: 입력 오디오 (-1.0 ~ 1.0 범위 기준)
+            out: int16 출력 버퍼 (audio와 같은 길이)
+        """
+        scaled = np.multiply(audio, 32767.0, dtype=np.float32)
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        out[:] = scaled
+
+    def _mix_tracks(stack, weights, out):
+        """
+        트랙 스택의 가중합을 out에 기록 (out[i] = Σ w_k·stack[k, i])
+
+        Args:
+            stack: (트랙 수, 샘플 수) 오디오 배열
+            weights: 트랙별 가중치 배열
+            out: 출력 버퍼 (길이 = 샘플 수)
+        """
+        np.einsum('ij,i->j', stack, weights.astype(stack.dtype, copy=False), out=out)
+
+
+def warmup():
+    """작은 입력으로 커널을 한 번 호출하여 JIT 컴파일/캐시 로드"""
+    out = np.zeros(16, dtype=np.float32)
+    params = np.ones(1, dtype=np.float64)
+    mix_sines(out, params, params, np.zeros(1, dtype=np.float64), 44100)
+    _fill_osc(out, 44100, 1.0, 0.0, 1.0)
+    _fill_chord(out, 44100, 1.0, params, params, 4)
+    _fill_sync(out, 44100, params, params, 1.0, 4)
+    _fill_toggle(out, 44100, 1.0, 1.0, 4)
+    _adsr_inplace(out, 4, 4, 8, 12, 12, 0.7)
+    _to_pcm16(out, np.empty(out.shape[0], dtype=np.int16))
+    _mix_tracks(out.reshape(2, 8), params.repeat(2), np.empty(8, dtype=np.float32))
+    svml = NUMBA_AVAILABLE and numba.config.USING_SVML
+    logger.info(f"Audio kernels ready (numba={NUMBA_AVAILABLE}, svml={svml})")
@@ -3,45 +3,53 @@
 측정 결과 디버깅 스크립트
 """
 
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from quantum_engine import QuantumSynthEngine, create_demo_circuits
 
+logger = logging.getLogger(__name__)
+
+
+def _measure(engine: QuantumSynthEngine, shots: int = 1024) -> dict:
+    """회로 하나의 측정 결과와 큐빗 확률 수집"""
+    return {
+        'counts': engine.measure_circuit(shots),
+        'qubit_probabilities': engine.get_qubit_probabilities(shots),
+        'circuit': str(engine.circuit).splitlines()
+    }
+
+
 def debug_measurement():
     """측정 결과 디버깅"""
-    print("=== 측정 결과 디버깅 ===")
-    
-    # 간단한 테스트 회로
-    engine = QuantumSynthEngine(3)
-    
-    print("\n1. 초기 상태 (모든 큐빗 |0⟩)")
-    counts = engine.measure_circuit(1024)
-    print(f"측정 결과: {counts}")
-    probs = engine.get_qubit_probabilities(1024)
-    print(f"큐빗 확률: {probs}")
-    
-    print("\n2. H 게이트 적용 후 (큐빗 0)")
-    engine.apply_hadamard(0)
-    counts = engine.measure_circuit(1024)
-    print(f"측정 결과: {counts}")
-    probs = engine.get_qubit_probabilities(1024)
-    print(f"큐빗 확률: {probs}")
-    
-    print("\n3. X 게이트 적용 후 (큐빗 1)")
-    engine.apply_pauli_x(1)
-    counts = engine.measure_circuit(1024)
-    print(f"측정 결과: {counts}")
-    probs = engine.get_qubit_probabilities(1024)
-    print(f"큐빗 확률: {probs}")
-    
-    print("\n4. 데모 회로 테스트")
-    demos = create_demo_circuits()
-    
-    for name, demo_engine in demos.items():
-        print(f"\n--- {name} ---")
-        counts = demo_engine.measure_circuit(1024)
-        print(f"측정 결과: {counts}")
-        probs = demo_engine.get_qubit_probabilities(1024)
-        print(f"큐빗 확률: {probs}")
-        print(f"회로: {demo_engine.circuit}")
+    # 간단한 테스트 회로 (단계별로 별도 엔진을 만들어 동시에 측정)
+    initial = QuantumSynthEngine(3)
+
+    after_h = QuantumSynthEngine(3)
+    after_h.apply_hadamard(0)
+
+    after_x = QuantumSynthEngine(3)
+    after_x.apply_hadamard(0)
+    after_x.apply_pauli_x(1)
+
+    engines = {
+        '1. 초기 상태 (모든 큐빗 |0⟩)': initial,
+        '2. H 게이트 적용 후 (큐빗 0)': after_h,
+        '3. X 게이트 적용 후 (큐빗 1)': after_x,
+    }
+
+    # 데모 회로 테스트
+    for name, demo_engine in create_demo_circuits().items():
+        engines[f'4. 데모 회로 - {name}'] = demo_engine
+
+    # 회로별 측정은 서로 독립적이므로 병렬 실행
+    with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+        futures = {name: executor.submit(_measure, engine) for name, engine in engines.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    logger.info("=== 측정 결과 디버깅 ===\n" + json.dumps(results, indent=2, ensure_ascii=False))
+    return results
 
 if __name__ == "__main__":
     debug_measurement()
@@ -3,98 +3,88 @@
 X 게이트 오디오 생성 디버깅
 """
 
+import json
+import logging
+
+import numpy as np
+
 from quantum_synth import QuantumCircuitSynthesizer, SynthConfig
 from quantum_engine import QuantumSynthEngine
 
+logger = logging.getLogger(__name__)
+
+
+def _synth_state(synth: QuantumCircuitSynthesizer) -> dict:
+    """신디사이저의 현재 큐빗 확률과 오디오 트랙 정보 수집"""
+    viz_data = synth.get_circuit_visualization_data()
+    track_info = synth.get_track_info()
+    return {
+        'qubit_probabilities': viz_data['qubit_probabilities'],
+        'num_tracks': len(track_info),
+        'tracks': track_info
+    }
+
+
 def debug_x_gate_audio():
     """X 게이트 오디오 생성 디버깅"""
-    print("=== X 게이트 오디오 디버깅 ===")
-    
+    report = {}
+
     # 신디사이저 초기화
     config = SynthConfig()
     synth = QuantumCircuitSynthesizer(config)
-    
-    print("\n1. 초기 상태 (모든 큐빗 |0⟩)")
-    viz_data = synth.get_circuit_visualization_data()
-    print(f"큐빗 확률: {viz_data['qubit_probabilities']}")
-    
-    # 오디오 트랙 정보
-    track_info = synth.get_track_info()
-    print(f"트랙 수: {len(track_info)}")
-    for i, track in enumerate(track_info):
-        print(f"  트랙 {i}: {track}")
-    
-    print("\n2. X 게이트 적용 (큐빗 0)")
+
+    report['1. 초기 상태 (모든 큐빗 |0⟩)'] = _synth_state(synth)
+
     result = synth.add_pauli_x_gate(0)
-    print(f"X 게이트 결과: {result}")
-    
-    # 상태 확인
-    viz_data = synth.get_circuit_visualization_data()
-    print(f"큐빗 확률: {viz_data['qubit_probabilities']}")
-    
-    # 오디오 트랙 정보
-    track_info = synth.get_track_info()
-    print(f"트랙 수: {len(track_info)}")
-    for i, track in enumerate(track_info):
-        print(f"  트랙 {i}: {track}")
-    
-    print("\n3. X 게이트 적용 (큐빗 1)")
+    report['2. X 게이트 적용 (큐빗 0)'] = {'result': result._asdict(), **_synth_state(synth)}
+
     result = synth.add_pauli_x_gate(1)
-    print(f"X 게이트 결과: {result}")
-    
-    # 상태 확인
-    viz_data = synth.get_circuit_visualization_data()
-    print(f"큐빗 확률: {viz_data['qubit_probabilities']}")
-    
-    # 오디오 트랙 정보
-    track_info = synth.get_track_info()
-    print(f"트랙 수: {len(track_info)}")
-    for i, track in enumerate(track_info):
-        print(f"  트랙 {i}: {track}")
-    
-    print("\n4. 오디오 생성 테스트")
+    report['3. X 게이트 적용 (큐빗 1)'] = {'result': result._asdict(), **_synth_state(synth)}
+
     try:
         mixed_audio = synth.get_mixed_audio()
-        print(f"오디오 길이: {len(mixed_audio)} 샘플")
-        print(f"오디오 최대값: {max(mixed_audio) if len(mixed_audio) > 0 else 0}")
-        print(f"오디오 최소값: {min(mixed_audio) if len(mixed_audio) > 0 else 0}")
-        
-        # Base64 인코딩 테스트
-        audio_base64 = synth.get_audio_base64()
-        print(f"Base64 길이: {len(audio_base64)} 문자")
-        
+        report['4. 오디오 생성 테스트'] = {
+            'length': len(mixed_audio),
+            'max': float(np.max(mixed_audio)) if len(mixed_audio) > 0 else 0,
+            'min': float(np.min(mixed_audio)) if len(mixed_audio) > 0 else 0,
+            # Base64 인코딩 테스트
+            'base64_length': len(synth.get_audio_base64())
+        }
     except Exception as e:
-        print(f"오디오 생성 오류: {e}")
-    
-    print("\n5. 직접 X 게이트 테스트")
+        report['4. 오디오 생성 테스트'] = {'error': str(e)}
+
     engine = QuantumSynthEngine(3)
-    
-    print("초기 상태:")
-    probs = engine.get_qubit_probabilities()
-    print(f"큐빗 확률: {probs}")
-    
-    print("\nX 게이트 적용 후:")
+    initial_probs = engine.get_qubit_probabilities()
     engine.apply_pauli_x(0)
-    probs = engine.get_qubit_probabilities()
-    print(f"큐빗 확률: {probs}")
-    
-    print("\n6. 오디오 매퍼 테스트")
+    report['5. 직접 X 게이트 테스트'] = {
+        'initial': initial_probs,
+        'after_x': engine.get_qubit_probabilities()
+    }
+
     from audio_generator import AudioGenerator, QuantumAudioMapper
-    
+
     audio_gen = AudioGenerator()
     mapper = QuantumAudioMapper(audio_gen)
-    
+
     # 확률 1.0 (X 게이트 결과)에 대한 오디오 생성
     test_prob = 1.0
     amplitude = mapper.probability_to_amplitude(test_prob)
-    print(f"확률 {test_prob} → 진폭 {amplitude}")
-    
+
     # 토글 웨이브 생성 테스트
     frequency = 220.0  # A3
     duration = 1.0
     toggle_audio = audio_gen.generate_toggle_wave(frequency, duration, amplitude)
-    print(f"토글 웨이브 길이: {len(toggle_audio)} 샘플")
-    print(f"토글 웨이브 최대값: {max(toggle_audio) if len(toggle_audio) > 0 else 0}")
+    report['6. 오디오 매퍼 테스트'] = {
+        'probability': test_prob,
+        'amplitude': amplitude,
+        'toggle_length': len(toggle_audio),
+        'toggle_max': float(np.max(toggle_audio)) if len(toggle_audio) > 0 else 0
+    }
+
+    # 결과를 한 번에 출력 (트랙 객체 등 JSON이 아닌 값은 문자열로)
+    logger.info("=== X 게이트 오디오 디버깅 ===\n" +
+                json.dumps(report, indent=2, ensure_ascii=False, default=str))
+    return report
 
 if __name__ == "__main__":
     debug_x_gate_audio()
@@ -8,8 +8,9 @@ import os
 os.environ['QISKIT_SUPPRESS_1_0_IMPORT_ERROR'] = '1'
 
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.quantum_info import Statevector
+from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from typing import Dict, List, Tuple, Optional
 import logging
 
@@ -27,6 +28,12 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 이 큐빗 수 이하에서는 NumPy 상태벡터로 직접 시뮬레이션 (Qiskit 시뮬레이터 호출 생략)
+NUMPY_SIM_MAX_QUBITS = 6
+
+# NumPy 시뮬레이션이 지원하는 게이트
+_NUMPY_SIM_GATES = {'h', 'x', 'cx'}
+
 
 class QuantumSynthEngine:
     """양자 회로 신디사이저 엔진"""
@@ -40,6 +47,25 @@ class QuantumSynthEngine:
         """
         self.num_qubits = num_qubits
         self.simulator = AerSimulator()
+        # 회로 버전별 캐시 (게이트 적용/초기화/교체 시 버전 증가 및 비움)
+        self._circuit_version = 0
+        self._sv_cache: Dict[int, np.ndarray] = {}
+        self._compiled_cache: Dict[int, QuantumCircuit] = {}
+        self._meas_cache: Dict[Tuple[int, int], Dict[str, int]] = {}
+        self._probs_cache: Dict[Tuple[int, Optional[int]], Dict[int, float]] = {}
+        
+        # 공유 회로 여부 (다른 곳과 공유 중이면 첫 게이트 적용 시 복사 - copy-on-write)
+        self._circuit_shared = False
+        
+        # 시뮬레이터용 트랜스파일 패스 매니저 (회로와 무관하므로 처음 필요할 때 한 번만 생성)
+        self._pass_manager = None
+        
+        # NumPy 상태벡터 (지원하지 않는 회로/큐빗 수이면 None → Qiskit 경로 사용)
+        self.sv: Optional[np.ndarray] = None
+        # 캐시/상태벡터에 반영된 회로 명령 수 (engine.circuit을 직접 수정한 경우 감지용)
+        self._synced_ops = 0
+        self._rng = np.random.default_rng()
+        
         self.circuit = None
         self.reset_circuit()
         
@@ -52,6 +78,130 @@ class QuantumSynthEngine:
         
         logger.info(f"QuantumSynthEngine initialized with {num_qubits} qubits")
     
+    @property
+    def circuit(self) -> QuantumCircuit:
+        """현재 양자 회로"""
+        return self._circuit
+    
+    @circuit.setter
+    def circuit(self, circuit: QuantumCircuit):
+        # 회로를 통째로 교체하는 경우(데모 로드 등)에도 캐시 무효화 및 상태벡터 재구성
+        self._circuit = circuit
+        self._circuit_shared = False
+        self._invalidate_cache()
+        self._rebuild_statevector()
+    
+    def load_shared_circuit(self, circuit: QuantumCircuit):
+        """
+        다른 곳과 공유하는 회로를 복사 없이 현재 회로로 설정 (게이트를 추가할 때 처음 한 번만 복사)
+        
+        Args:
+            circuit: 공유 회로 (이 엔진이 수정하지 않음)
+        """
+        self.circuit = circuit
+        self._circuit_shared = True
+    
+    def _writable_circuit(self) -> QuantumCircuit:
+        """
+        게이트를 추가할 수 있는 현재 회로 반환 (공유 회로이면 먼저 복사)
+        
+        Returns:
+            이 엔진이 단독으로 소유한 회로
+        """
+        if self._circuit_shared:
+            # 내용이 같으므로 캐시/상태벡터는 그대로 유지
+            self._circuit = self._circuit.copy()
+            self._circuit_shared = False
+        return self._circuit
+    
+    def _invalidate_cache(self):
+        """회로 변경 시 버전을 올리고 상태벡터/컴파일/측정 캐시 무효화"""
+        self._circuit_version += 1
+        self._synced_ops = len(self._circuit.data) if self._circuit is not None else 0
+        self._sv_cache.clear()
+        self._compiled_cache.clear()
+        self._meas_cache.clear()
+        self._probs_cache.clear()
+    
+    def _sync_circuit(self):
+        """engine.circuit에 직접 추가된 게이트가 있으면 캐시 무효화 및 상태벡터 재구성"""
+        if self._circuit is not None and len(self._circuit.data) != self._synced_ops:
+            self._invalidate_cache()
+            self._rebuild_statevector()
+    
+    def _rebuild_statevector(self):
+        """현재 회로의 게이트를 |0...0⟩에서부터 다시 적용하여 NumPy 상태벡터 재구성"""
+        circuit = self._circuit
+        if (circuit is None or self.num_qubits > NUMPY_SIM_MAX_QUBITS
+                or circuit.num_qubits != self.num_qubits):
+            self.sv = None
+            return
+        
+        self.sv = np.zeros(2 ** self.num_qubits, dtype=np.complex128)
+        self.sv[0] = 1.0
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            if name == 'barrier':
+                continue
+            self._apply_sv_gate(name, [circuit.find_bit(q).index for q in instruction.qubits])
+            if self.sv is None:
+                return
+    
+    def _apply_sv_gate(self, name: str, qubits: List[int]):
+        """
+        NumPy 상태벡터에 게이트를 제자리 적용 (지원하지 않는 게이트면 상태벡터 폐기)
+        
+        Args:
+            name: 게이트 이름 ('h', 'x', 'cx')
+            qubits: 게이트가 작용하는 큐빗 인덱스 리스트
+        """
+        if self.sv is None:
+            return
+        if name not in _NUMPY_SIM_GATES:
+            self.sv = None
+            return
+        
+        # (2,)*n 텐서 뷰 - 축 0이 최상위 비트(마지막 큐빗)
+        psi = self.sv.reshape([2] * self.num_qubits)
+        if name == 'cx':
+            control, target = qubits
+            fixed = {control: 1}
+        else:
+            target = qubits[0]
+            fixed = {}
+        amp0 = self._basis_view(psi, {**fixed, target: 0})
+        amp1 = self._basis_view(psi, {**fixed, target: 1})
+        
+        if name == 'h':
+            # (a0, a1) → ((a0 + a1)/√2, (a0 - a1)/√2)
+            scale = 1 / np.sqrt(2)
+            diff = amp0 - amp1
+            amp0 += amp1
+            amp0 *= scale
+            np.multiply(diff, scale, out=amp1)
+        else:
+            # X / CNOT(제어=1 부분공간): 타겟 큐빗의 0/1 진폭 교환
+            swapped = amp0.copy()
+            amp0[...] = amp1
+            amp1[...] = swapped
+    
+    def _basis_view(self, psi: np.ndarray, fixed: Dict[int, int]) -> np.ndarray:
+        """
+        지정한 큐빗 값들로 고정된 상태벡터 부분 뷰 반환
+        
+        Args:
+            psi: (2,)*n 형태의 상태벡터 텐서
+            fixed: {큐빗 인덱스: 비트 값}
+            
+        Returns:
+            psi의 뷰 (수정 시 상태벡터에 반영됨)
+        """
+        index = [slice(None)] * self.num_qubits
+        for qubit, bit in fixed.items():
+            index[self.num_qubits - 1 - qubit] = bit
+        # Ellipsis를 붙여 모든 축이 고정돼도 스칼라가 아닌 0차원 뷰를 반환
+        return psi[tuple(index) + (Ellipsis,)]
+    
     def reset_circuit(self):
         """양자 회로 초기화"""
         self.qreg = QuantumRegister(self.num_qubits, 'q')
@@ -67,7 +217,9 @@ class QuantumSynthEngine:
             qubit: 게이트를 적용할 큐빗 인덱스
         """
         if 0 <= qubit < self.num_qubits:
-            self.circuit.h(qubit)
+            self._writable_circuit().h(qubit)
+            self._invalidate_cache()
+            self._apply_sv_gate('h', [qubit])
             logger.info(f"Hadamard gate applied to qubit {qubit}")
         else:
             raise ValueError(f"Invalid qubit index: {qubit}")
@@ -80,7 +232,9 @@ class QuantumSynthEngine:
             qubit: 게이트를 적용할 큐빗 인덱스
         """
         if 0 <= qubit < self.num_qubits:
-            self.circuit.x(qubit)
+            self._writable_circuit().x(qubit)
+            self._invalidate_cache()
+            self._apply_sv_gate('x', [qubit])
             logger.info(f"Pauli-X gate applied to qubit {qubit}")
         else:
             raise ValueError(f"Invalid qubit index: {qubit}")
@@ -96,7 +250,9 @@ class QuantumSynthEngine:
         if (0 <= control < self.num_qubits and 
             0 <= target < self.num_qubits and 
             control != target):
-            self.circuit.cx(control, target)
+            self._writable_circuit().cx(control, target)
+            self._invalidate_cache()
+            self._apply_sv_gate('cx', [control, target])
             logger.info(f"CNOT gate applied: control={control}, target={target}")
         else:
             raise ValueError(f"Invalid CNOT parameters: control={control}, target={target}")
@@ -108,8 +264,17 @@ class QuantumSynthEngine:
         Returns:
             복소수 배열로 표현된 상태벡터
         """
+        self._sync_circuit()
+        if self.sv is not None:
+            return self.sv.copy()
+        
+        version = self._circuit_version
+        if version in self._sv_cache:
+            return self._sv_cache[version]
+        
         try:
             statevector = Statevector.from_instruction(self.circuit)
+            self._sv_cache[version] = statevector.data
             return statevector.data
         except Exception as e:
             logger.error(f"Error getting statevector: {e}")
@@ -124,26 +289,86 @@ class QuantumSynthEngine:
             
         Returns:
             측정 결과 딕셔너리 {'000': count, '001': count, ...}
+            (같은 회로/측정 횟수에 대해서는 캐시된 결과의 복사본)
         """
-        # 측정 게이트 추가
-        temp_circuit = self.circuit.copy()
-        temp_circuit.measure_all()
+        self._sync_circuit()
+        version = self._circuit_version
+        cache_key = (version, shots)
+        if cache_key in self._meas_cache:
+            return dict(self._meas_cache[cache_key])
+        
+        if self.sv is not None:
+            counts = self._sample_statevector(shots)
+            self._meas_cache[cache_key] = counts
+            return dict(counts)
         
         try:
-            # 회로 컴파일 및 실행
-            compiled_circuit = transpile(temp_circuit, self.simulator)
+            # 실행용 회로 준비 (측정 횟수와 무관하므로 회로 버전별로 캐시)
+            compiled_circuit = self._compiled_cache.get(version)
+            if compiled_circuit is None:
+                compiled_circuit = self._compile_measurement_circuit()
+                self._compiled_cache[version] = compiled_circuit
+            
+            # 실행
             job = self.simulator.run(compiled_circuit, shots=shots)
             result = job.result()
             counts = result.get_counts()
+            self._meas_cache[cache_key] = counts
             
             logger.info(f"Circuit measured with {shots} shots")
-            return counts
+            return dict(counts)
             
         except Exception as e:
             logger.error(f"Error measuring circuit: {e}")
             # 기본값 반환 (모든 큐빗이 0 상태)
             return {'0' * self.num_qubits: shots}
     
+    def _sample_statevector(self, shots: int) -> Dict[str, int]:
+        """
+        NumPy 상태벡터에서 측정 결과 샘플링 (Qiskit measure_all 결과와 같은 키 형식)
+        
+        Args:
+            shots: 측정 횟수
+            
+        Returns:
+            측정 결과 딕셔너리 {'측정 비트 고전 레지스터': count, ...}
+        """
+        state_probs = np.abs(self.sv) ** 2
+        state_probs /= state_probs.sum()
+        samples = self._rng.multinomial(shots, state_probs)
+        
+        # measure_all은 새 레지스터('meas')를 추가하므로 기존 고전 레지스터(모두 0)가 뒤에 붙음
+        creg_bits = ' ' + '0' * self.circuit.num_clbits if self.circuit.num_clbits else ''
+        return {
+            format(state, f'0{self.num_qubits}b') + creg_bits: int(count)
+            for state, count in enumerate(samples) if count > 0
+        }
+    
+    def _compile_measurement_circuit(self) -> QuantumCircuit:
+        """
+        측정 게이트를 추가한 실행용 회로 생성
+        
+        H/X/CNOT/측정은 시뮬레이터의 기본 게이트이므로 트랜스파일을 생략하고,
+        지원하지 않는 게이트가 있을 때만 캐시된 패스 매니저로 최적화 없이(optimization_level=0) 변환한다.
+        
+        Returns:
+            시뮬레이터에서 바로 실행 가능한 회로
+        """
+        # 측정 게이트 추가
+        temp_circuit = self.circuit.copy()
+        temp_circuit.measure_all()
+        
+        native_ops = getattr(self.simulator, 'operation_names', None)
+        if native_ops is not None:
+            used_ops = set(temp_circuit.count_ops()) - {'barrier'}
+            if used_ops <= set(native_ops):
+                return temp_circuit
+        
+        if self._pass_manager is None:
+            self._pass_manager = generate_preset_pass_manager(optimization_level=0,
+                                                              backend=self.simulator)
+        return self._pass_manager.run(temp_circuit)
+    
     def get_measurement_probabilities(self, shots: int = 1024) -> Dict[str, float]:
         """
         측정 확률 계산
@@ -171,27 +396,51 @@ class QuantumSynthEngine:
             shots: 측정 횟수
             
         Returns:
-            큐빗별 |1⟩ 확률 딕셔너리
+            큐빗별 |1⟩ 확률 딕셔너리 (같은 회로/측정 횟수에 대해서는 캐시된 결과의 복사본)
         """
+        self._sync_circuit()
+        cache_key = (self._circuit_version, shots)
+        if cache_key in self._probs_cache:
+            return dict(self._probs_cache[cache_key])
+        
         counts = self.measure_circuit(shots)
-        total_shots = sum(counts.values())
         
-        qubit_probs = {i: 0.0 for i in range(self.num_qubits)}
+        # 측정 결과를 (상태 정수, 횟수) 배열로 변환
+        # 공백으로 분리된 경우 첫 번째 부분만 사용 (클래식 비트 부분)
+        states = np.fromiter((int(state.split()[0], 2) for state in counts), dtype=np.int64,
+                             count=len(counts))
+        state_counts = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
         
-        for state, count in counts.items():
-            # 공백으로 분리된 경우 첫 번째 부분만 사용 (클래식 비트 부분)
-            if ' ' in state:
-                state = state.split()[0]
-            
-            # 상태 문자열을 큐빗 수에 맞게 패딩
-            padded_state = state.zfill(self.num_qubits)
-            
-            # 상태 문자열을 역순으로 읽어야 함 (Qiskit 규칙)
-            for i, bit in enumerate(reversed(padded_state)):
-                if i < self.num_qubits and bit == '1':
-                    qubit_probs[i] += count / total_shots
+        # 상태 정수의 i번째 비트 = 큐빗 i (Qiskit 규칙: 문자열 역순)
+        qubit_ones = (states[:, None] >> np.arange(self.num_qubits)) & 1
+        ones_probs = state_counts @ qubit_ones / state_counts.sum()
+        
+        qubit_probs = {i: float(p) for i, p in enumerate(ones_probs)}
+        self._probs_cache[cache_key] = qubit_probs
+        return dict(qubit_probs)
+    
+    def get_qubit_probabilities_exact(self) -> Dict[int, float]:
+        """
+        각 큐빗의 |1⟩ 상태 확률을 상태벡터로부터 정확히 계산 (샘플링/트랜스파일 없음)
+        
+        Returns:
+            큐빗별 |1⟩ 확률 딕셔너리 (같은 회로에 대해서는 캐시된 결과의 복사본)
+        """
+        self._sync_circuit()
+        cache_key = (self._circuit_version, None)
+        if cache_key in self._probs_cache:
+            return dict(self._probs_cache[cache_key])
+        
+        state_probs = np.abs(self.sv if self.sv is not None else self.get_statevector()) ** 2
+        
+        # 기저 상태 인덱스의 i번째 비트 = 큐빗 i의 값 (Qiskit 리틀 엔디안 규칙)
+        indices = np.arange(len(state_probs))
+        bits = (indices[:, None] >> np.arange(self.num_qubits)) & 1
+        ones_probs = state_probs @ bits
         
-        return qubit_probs
+        qubit_probs = {i: float(p) for i, p in enumerate(ones_probs)}
+        self._probs_cache[cache_key] = qubit_probs
+        return dict(qubit_probs)
     
     def get_circuit_info(self) -> Dict:
         """
@@ -4,10 +4,18 @@ Quantum Circuit Synthesizer - Main Integration Logic
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Deque, NamedTuple
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from dataclasses import dataclass
 import time
+import sys
+
+from qiskit import QuantumCircuit
 
 from quantum_engine import QuantumSynthEngine, create_demo_circuits
 from audio_generator import AudioGenerator, QuantumAudioMapper
@@ -16,8 +24,18 @@ from audio_generator import AudioGenerator, QuantumAudioMapper
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 합성 히스토리 최대 보관 개수 (오래된 기록부터 버림)
+SYNTHESIS_HISTORY_SIZE = 64
+
+# 트랙 정보로 내보내는 AudioTrack 필드 (audio_length는 별도 계산)
+TRACK_INFO_FIELDS = ('qubit_id', 'frequency', 'probability', 'amplitude', 'gate_type', 'duration')
+_track_info_values = attrgetter(*TRACK_INFO_FIELDS)
+
+# 데이터 클래스 인스턴스의 __dict__ 제거 (slots 인자는 Python 3.10 이상에서만 지원)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SynthConfig:
     """신디사이저 설정 클래스"""
     sample_rate: int = 44100
@@ -29,7 +47,7 @@ class SynthConfig:
     master_volume: float = 0.8
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AudioTrack:
     """오디오 트랙 데이터 클래스"""
     qubit_id: int
@@ -39,6 +57,19 @@ class AudioTrack:
     gate_type: str
     audio_data: np.ndarray
     duration: float
+    scale: float = 1.0  # 믹싱 시 audio_data에 곱할 배율 (공유 파형을 복사 없이 사용)
+
+
+class GateResult(NamedTuple):
+    """게이트 적용/데모 로드 결과 (JSON 등으로 내보낼 때만 _asdict()로 딕셔너리 변환)"""
+    success: bool
+    gate_type: Optional[str] = None
+    qubit: Optional[int] = None
+    control: Optional[int] = None
+    target: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    demo_name: Optional[str] = None
 
 
 class QuantumCircuitSynthesizer:
@@ -58,21 +89,41 @@ class QuantumCircuitSynthesizer:
         self.audio_generator = AudioGenerator(self.config.sample_rate)
         self.audio_mapper = QuantumAudioMapper(self.audio_generator)
         
+        # 단일 큐빗 게이트 트랙 행렬 (행 = 큐빗, 트랙 오디오는 이 행의 뷰 - 다음 합성 시 덮어씀,
+        # 재생 길이가 바뀌면 _track_rows에서 재할당)
+        self._track_matrix = np.zeros((self.config.num_qubits, self._num_samples),
+                                      dtype=self.audio_generator.dtype)
+        
+        # 믹싱 결과 버퍼 (get_mixed_audio 호출 간 재사용, 재생 길이가 바뀌면 재할당)
+        self._mix_buffer = np.empty(self._num_samples, dtype=self.audio_generator.dtype)
+        
         # 상태 변수
         self.current_tracks: List[AudioTrack] = []
-        self.synthesis_history: List[Dict] = []
+        self.synthesis_history: Deque[Dict] = deque(maxlen=SYNTHESIS_HISTORY_SIZE)  # 최근 기록만 유지
         self.is_playing = False
         
+        # 마지막 Base64 오디오 ((마스터 볼륨, 트랙 키), 문자열) - 합성/초기화 시 비움
+        self._b64_cache: Optional[Tuple[Tuple, str]] = None
+        
+        # 큐빗별 단위 진폭 파형 캐시 (주파수/길이/샘플링 레이트가 같으면 진폭만 곱해 재사용)
+        # 재생 길이가 바뀌면 이전 길이의 파형은 다시 쓰이지 않으므로 비움
+        self._waveform_cache: Dict[Tuple[int, str, bool, float, int, bool], np.ndarray] = {}
+        self._waveform_cache_duration = self.config.default_duration
+        
+        # 큐빗별 파형 동시 생성용 스레드 풀 (스레드는 첫 작업 제출 시 생성)
+        self._executor = ThreadPoolExecutor(max_workers=self.config.num_qubits)
+        
         logger.info("QuantumCircuitSynthesizer initialized")
     
     def reset_circuit(self):
         """양자 회로 및 오디오 트랙 초기화"""
         self.quantum_engine.reset_circuit()
         self.current_tracks.clear()
+        self._b64_cache = None
         self.is_playing = False
         logger.info("Circuit and tracks reset")
     
-    def add_hadamard_gate(self, qubit: int) -> Dict[str, Any]:
+    def add_hadamard_gate(self, qubit: int) -> GateResult:
         """
         하다마드 게이트 추가 및 오디오 생성
         
@@ -80,7 +131,8 @@ class QuantumCircuitSynthesizer:
             qubit: 타겟 큐빗
             
         Returns:
-            게이트 적용 결과 정보
+            게이트 적용 결과 (GateResult, result['tracks']의 오디오는 내부 트랙 행렬의 뷰 -
+            다음 게이트 적용 시 덮어쓰므로 보관하려면 복사할 것)
         """
         try:
             # 양자 게이트 적용
@@ -90,21 +142,13 @@ class QuantumCircuitSynthesizer:
             result = self._synthesize_current_state('h', qubit)
             
             logger.info(f"Hadamard gate added to qubit {qubit}")
-            return {
-                'success': True,
-                'gate_type': 'hadamard',
-                'qubit': qubit,
-                'result': result
-            }
+            return GateResult(True, gate_type='hadamard', qubit=qubit, result=result)
             
         except Exception as e:
             logger.error(f"Error adding Hadamard gate: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return GateResult(False, error=str(e))
     
-    def add_pauli_x_gate(self, qubit: int) -> Dict[str, Any]:
+    def add_pauli_x_gate(self, qubit: int) -> GateResult:
         """
         Pauli-X 게이트 추가 및 오디오 생성
         
@@ -112,7 +156,8 @@ class QuantumCircuitSynthesizer:
             qubit: 타겟 큐빗
             
         Returns:
-            게이트 적용 결과 정보
+            게이트 적용 결과 (GateResult, result['tracks']의 오디오는 내부 트랙 행렬의 뷰 -
+            다음 게이트 적용 시 덮어쓰므로 보관하려면 복사할 것)
         """
         try:
             # 양자 게이트 적용
@@ -122,21 +167,13 @@ class QuantumCircuitSynthesizer:
             result = self._synthesize_current_state('x', qubit)
             
             logger.info(f"Pauli-X gate added to qubit {qubit}")
-            return {
-                'success': True,
-                'gate_type': 'pauli_x',
-                'qubit': qubit,
-                'result': result
-            }
+            return GateResult(True, gate_type='pauli_x', qubit=qubit, result=result)
             
         except Exception as e:
             logger.error(f"Error adding Pauli-X gate: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return GateResult(False, error=str(e))
     
-    def add_cnot_gate(self, control: int, target: int) -> Dict[str, Any]:
+    def add_cnot_gate(self, control: int, target: int) -> GateResult:
         """
         CNOT 게이트 추가 및 오디오 생성
         
@@ -145,7 +182,8 @@ class QuantumCircuitSynthesizer:
             target: 타겟 큐빗
             
         Returns:
-            게이트 적용 결과 정보
+            게이트 적용 결과 (GateResult, 두 트랙의 오디오는 같은 하모니 파형 배열을 공유하며
+            audio_data에 scale을 곱한 값이 트랙 오디오)
         """
         try:
             # 양자 게이트 적용
@@ -155,20 +193,11 @@ class QuantumCircuitSynthesizer:
             result = self._synthesize_current_state('cx', [control, target])
             
             logger.info(f"CNOT gate added: control={control}, target={target}")
-            return {
-                'success': True,
-                'gate_type': 'cnot',
-                'control': control,
-                'target': target,
-                'result': result
-            }
+            return GateResult(True, gate_type='cnot', control=control, target=target, result=result)
             
         except Exception as e:
             logger.error(f"Error adding CNOT gate: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return GateResult(False, error=str(e))
     
     def _synthesize_current_state(self, gate_type: str, affected_qubits) -> Dict[str, Any]:
         """
@@ -179,23 +208,26 @@ class QuantumCircuitSynthesizer:
             affected_qubits: 영향받은 큐빗(들)
             
         Returns:
-            합성 결과 정보
+            합성 결과 정보 (단일 큐빗 게이트 트랙의 오디오는 트랙 행렬의 뷰 - 다음 합성 시 덮어씀)
         """
-        # 큐빗 확률 측정
+        # 큐빗 확률 측정 (같은 회로/측정 횟수이면 엔진에 캐시된 결과 사용)
         qubit_probabilities = self.quantum_engine.get_qubit_probabilities(
             self.config.measurement_shots
         )
         
+        # 모든 큐빗의 진폭을 한 번에 계산
+        qubit_amplitudes = self.audio_mapper.probability_to_amplitude(
+            np.array([qubit_probabilities[q] for q in range(self.config.num_qubits)]),
+            min_threshold=self.config.min_probability_threshold
+        )
+        
         # 오디오 트랙 생성
         new_tracks = []
         
         if gate_type == 'cx' and isinstance(affected_qubits, list):
             # CNOT: 동기화된 하모니 생성
             frequencies = [self.audio_mapper.qubit_frequencies[q] for q in affected_qubits]
-            amplitudes = [
-                self.audio_mapper.probability_to_amplitude(qubit_probabilities[q])
-                for q in affected_qubits
-            ]
+            amplitudes = qubit_amplitudes[affected_qubits].tolist()
             
             # 동기화된 하모니 생성
             harmony_audio = self.audio_generator.generate_synchronized_harmony(
@@ -205,7 +237,8 @@ class QuantumCircuitSynthesizer:
                 sync_factor=0.8
             )
             
-            # 각 큐빗별 트랙 생성
+            # 각 큐빗별 트랙 생성 (하모니 파형은 공유하고 배율만 트랙별로 기록)
+            max_amplitude = max(amplitudes)
             for i, qubit in enumerate(affected_qubits):
                 track = AudioTrack(
                     qubit_id=qubit,
@@ -213,8 +246,9 @@ class QuantumCircuitSynthesizer:
                     probability=qubit_probabilities[qubit],
                     amplitude=amplitudes[i],
                     gate_type=gate_type,
-                    audio_data=harmony_audio * (amplitudes[i] / max(amplitudes) if max(amplitudes) > 0 else 0),
-                    duration=self.config.default_duration
+                    audio_data=harmony_audio,
+                    duration=self.config.default_duration,
+                    scale=amplitudes[i] / max_amplitude if max_amplitude > 0 else 0.0
                 )
                 new_tracks.append(track)
         
@@ -225,27 +259,29 @@ class QuantumCircuitSynthesizer:
             else:
                 qubits_to_process = [affected_qubits]
             
+            # 임계값 미만 큐빗은 무음이므로 파형 없이 빈 트랙으로 처리
+            audible_qubits = [q for q in qubits_to_process
+                              if qubit_probabilities[q] >= self.config.min_probability_threshold]
+            skipped_qubits = [q for q in qubits_to_process if q not in audible_qubits]
+            if skipped_qubits:
+                logger.debug(f"Skipping below-threshold qubits: {skipped_qubits}")
+            
+            # 캐시된 단위 파형에 진폭을 곱해 트랙 행렬의 큐빗 행에 직접 기록 (새 배열 할당 없음)
+            track_audio = {}
+            track_matrix = self._track_rows()
+            bases = self._base_waveforms(audible_qubits, gate_type, qubit_probabilities)
+            for qubit, base in zip(audible_qubits, bases):
+                track_audio[qubit] = np.multiply(base, qubit_amplitudes[qubit],
+                                                 out=track_matrix[qubit])
+            silent_audio = np.zeros(0, dtype=self.audio_generator.dtype)
+            
             for qubit in qubits_to_process:
-                probability = qubit_probabilities[qubit]
-                amplitude = self.audio_mapper.probability_to_amplitude(probability)
-                
-                # 큐빗별 오디오 생성
-                audio_data = self.audio_mapper.generate_qubit_audio(
-                    qubit_id=qubit,
-                    probability=probability,
-                    gate_type=gate_type,
-                    duration=self.config.default_duration
-                )
-                
-                # 엔벨로프 적용
-                if self.config.enable_envelope and len(audio_data) > 0:
-                    audio_data = self.audio_generator.apply_envelope(audio_data)
-                
+                audio_data = track_audio.get(qubit, silent_audio)
                 track = AudioTrack(
                     qubit_id=qubit,
                     frequency=self.audio_mapper.qubit_frequencies[qubit],
-                    probability=probability,
-                    amplitude=amplitude,
+                    probability=qubit_probabilities[qubit],
+                    amplitude=float(qubit_amplitudes[qubit]),
                     gate_type=gate_type,
                     audio_data=audio_data,
                     duration=self.config.default_duration
@@ -264,6 +300,7 @@ class QuantumCircuitSynthesizer:
             'num_tracks': len(new_tracks)
         }
         self.synthesis_history.append(synthesis_record)
+        self._b64_cache = None
         
         return {
             'probabilities': qubit_probabilities,
@@ -271,35 +308,146 @@ class QuantumCircuitSynthesizer:
             'synthesis_record': synthesis_record
         }
     
-    def get_mixed_audio(self, normalize: bool = True) -> np.ndarray:
+    def _track_rows(self) -> np.ndarray:
+        """
+        단일 큐빗 게이트 트랙 행렬 반환 (재생 길이가 바뀌었으면 새 길이로 재할당)
+        
+        Returns:
+            (큐빗 수, 샘플 수) 트랙 행렬
+        """
+        num_samples = self._num_samples
+        if self._track_matrix.shape[1] != num_samples:
+            # 이전 행렬의 뷰를 가진 트랙은 그대로 두고 새 행렬에 기록
+            self._track_matrix = np.zeros((self.config.num_qubits, num_samples),
+                                          dtype=self.audio_generator.dtype)
+        return self._track_matrix
+    
+    def _waveform_key(self, qubit: int, gate_type: str,
+                      probability: float) -> Tuple[int, str, bool, float, int, bool]:
+        """
+        단위 파형 캐시 키 반환
+        
+        Args:
+            qubit: 큐빗 ID
+            gate_type: 적용된 게이트 타입
+            probability: 측정 확률 (Pauli-X의 ON/OFF 판정에만 사용)
+            
+        Returns:
+            (큐빗, 게이트 타입, ON 여부, 지속 시간, 샘플링 레이트, 엔벨로프 적용 여부) 튜플
+        """
+        # 파형은 진폭에 선형이므로 진폭 대신 Pauli-X ON/OFF 상태만 키에 포함
+        # (엔벨로프는 캐시 배열에 미리 적용되므로 설정 값도 키에 포함)
+        is_on = gate_type != 'x' or probability > 0.5
+        return (qubit, gate_type, is_on, self.config.default_duration,
+                self.audio_generator.sample_rate, self.config.enable_envelope)
+    
+    def _base_waveforms(self, qubits: List[int], gate_type: str,
+                        probabilities: Dict[int, float]) -> List[np.ndarray]:
+        """
+        여러 큐빗의 단위 진폭 파형 반환 (캐시에 없는 파형이 2개 이상이면 스레드 풀에서 동시에 생성)
+        
+        Args:
+            qubits: 큐빗 ID 리스트
+            gate_type: 적용된 게이트 타입
+            probabilities: 큐빗별 측정 확률
+            
+        Returns:
+            qubits 순서의 단위 파형 리스트 (캐시 배열 - 수정하지 말 것)
+        """
+        # 재생 길이가 바뀌면 이전 길이의 파형을 버려 캐시가 슬라이더 값마다 쌓이지 않게 함
+        if self._waveform_cache_duration != self.config.default_duration:
+            self._waveform_cache.clear()
+            self._waveform_cache_duration = self.config.default_duration
+        
+        missing = [q for q in qubits
+                   if self._waveform_key(q, gate_type, probabilities[q]) not in self._waveform_cache]
+        if len(missing) >= 2:
+            # 큐빗마다 출력 배열이 분리되어 있고 커널은 GIL을 놓으므로 동시 실행 가능
+            list(self._executor.map(
+                lambda q: self._base_waveform(q, gate_type, probabilities[q]), missing
+            ))
+        return [self._base_waveform(q, gate_type, probabilities[q]) for q in qubits]
+    
+    def _base_waveform(self, qubit: int, gate_type: str, probability: float) -> np.ndarray:
+        """
+        큐빗의 단위 진폭 파형 반환 (엔벨로프 포함, 처음 요청 시 한 번만 생성)
+        
+        Args:
+            qubit: 큐빗 ID
+            gate_type: 적용된 게이트 타입
+            probability: 측정 확률 (Pauli-X의 ON/OFF 판정에만 사용)
+            
+        Returns:
+            진폭 1.0 기준 오디오 데이터 (캐시 배열 - 수정하지 말 것)
+        """
+        key = self._waveform_key(qubit, gate_type, probability)
+        _, _, is_on, duration, sample_rate, enable_envelope = key
+        base = self._waveform_cache.get(key)
+        if base is None:
+            # 캐시 배열에 직접 생성하고 엔벨로프를 제자리 적용 (스크래치 버퍼 경유 복사 없음)
+            # 버퍼 길이는 키의 지속 시간/샘플링 레이트 기준 (재생 길이 변경 시 새 키로 생성)
+            base = self.audio_mapper.generate_qubit_audio(
+                qubit_id=qubit,
+                probability=1.0 if is_on else 0.0,
+                gate_type=gate_type,
+                duration=duration,
+                out=np.empty(int(sample_rate * duration), dtype=self.audio_generator.dtype)
+            )
+            
+            # 엔벨로프 적용
+            if enable_envelope and len(base) > 0:
+                base = self.audio_generator.apply_envelope(base)
+            
+            self._waveform_cache[key] = base
+        return base
+    
+    @property
+    def _num_samples(self) -> int:
+        """트랙당 샘플 수 (재생 길이 설정이 바뀔 수 있으므로 호출 시마다 설정에서 계산)"""
+        return int(self.config.sample_rate * self.config.default_duration)
+    
+    def get_mixed_audio(self, normalize: bool = True, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         모든 트랙을 믹싱하여 최종 오디오 생성
         
         Args:
             normalize: 정규화 여부
+            out: 결과를 기록할 재사용 버퍼 (None이면 내부 믹싱 버퍼 사용)
             
         Returns:
-            믹싱된 오디오 데이터
+            믹싱된 오디오 데이터 (out 또는 내부 버퍼의 뷰 - 다음 호출 시 덮어씀)
         """
-        if not self.current_tracks:
-            return np.zeros(int(self.config.sample_rate * self.config.default_duration))
+        if out is None:
+            # 재생 길이가 바뀌었으면 내부 믹싱 버퍼를 새 길이로 재할당
+            if len(self._mix_buffer) != self._num_samples:
+                self._mix_buffer = np.empty(self._num_samples, dtype=self.audio_generator.dtype)
+            out = self._mix_buffer
         
         # 트랙별 오디오 데이터 수집
         track_audios = [track.audio_data for track in self.current_tracks if len(track.audio_data) > 0]
         
         if not track_audios:
-            return np.zeros(int(self.config.sample_rate * self.config.default_duration))
-        
-        # 트랙 가중치 (확률 기반)
-        weights = [track.amplitude for track in self.current_tracks if len(track.audio_data) > 0]
+            num_samples = self._num_samples
+            if out is not None and len(out) >= num_samples:
+                silence = out[:num_samples]
+                silence.fill(0.0)
+                return silence
+            return np.zeros(num_samples, dtype=self.audio_generator.dtype)
         
-        # 믹싱
-        mixed_audio = self.audio_generator.mix_audio_tracks(track_audios, weights)
+        # 트랙 가중치 (확률 기반, 트랙 배율을 가중치에 합쳐 한 번의 가중합으로 처리)
+        audible_tracks = [track for track in self.current_tracks if len(track.audio_data) > 0]
+        weights = [track.amplitude * track.scale for track in audible_tracks]
         
-        # 마스터 볼륨 적용
-        mixed_audio *= self.config.master_volume
+        # 모든 트랙이 트랙 행렬의 행이면 복사 없이 행렬 전체를 가중합 (트랙이 없는 행은 가중치 0)
+        if all(track.audio_data.base is self._track_matrix for track in audible_tracks):
+            row_weights = np.zeros(len(self._track_matrix))
+            for track, weight in zip(audible_tracks, weights):
+                row_weights[track.qubit_id] += weight
+            track_audios, weights = self._track_matrix, row_weights
         
-        return mixed_audio
+        # 믹싱 (마스터 볼륨은 정규화 배율에 합쳐 별도 패스 없이 적용)
+        return self.audio_generator.mix_audio_tracks(track_audios, weights, out=out,
+                                                     level=0.8 * self.config.master_volume)
     
     def get_track_info(self) -> List[Dict]:
         """
@@ -308,20 +456,10 @@ class QuantumCircuitSynthesizer:
         Returns:
             트랙 정보 리스트
         """
-        track_info = []
-        for track in self.current_tracks:
-            info = {
-                'qubit_id': track.qubit_id,
-                'frequency': track.frequency,
-                'probability': track.probability,
-                'amplitude': track.amplitude,
-                'gate_type': track.gate_type,
-                'duration': track.duration,
-                'audio_length': len(track.audio_data)
-            }
-            track_info.append(info)
-        
-        return track_info
+        return [
+            dict(zip(TRACK_INFO_FIELDS, _track_info_values(track)), audio_length=len(track.audio_data))
+            for track in self.current_tracks
+        ]
     
     def get_circuit_visualization_data(self) -> Dict:
         """
@@ -332,14 +470,15 @@ class QuantumCircuitSynthesizer:
         """
         circuit_info = self.quantum_engine.get_circuit_info()
         gate_sequence = self.quantum_engine.get_gate_sequence()
-        qubit_probs = self.quantum_engine.get_qubit_probabilities()
+        qubit_probs = self.quantum_engine.get_qubit_probabilities_exact()
         
         return {
             'circuit_info': circuit_info,
             'gate_sequence': gate_sequence,
             'qubit_probabilities': qubit_probs,
             'track_info': self.get_track_info(),
-            'synthesis_history': self.synthesis_history[-10:]  # 최근 10개만
+            'synthesis_history': list(islice(self.synthesis_history,
+                                             max(0, len(self.synthesis_history) - 10), None))  # 최근 10개만
         }
     
     def export_audio_file(self, filename: str = None) -> str:
@@ -366,12 +505,20 @@ class QuantumCircuitSynthesizer:
         현재 오디오를 Base64 문자열로 반환 (웹 재생용)
         
         Returns:
-            Base64 인코딩된 오디오 데이터
+            Base64 인코딩된 오디오 데이터 (트랙이 바뀌지 않았으면 캐시된 문자열)
         """
+        # 트랙 구성이 같으면 믹싱/WAV 직렬화/인코딩을 다시 하지 않음
+        key = (self.config.master_volume,
+               tuple((id(t.audio_data), t.amplitude, t.scale) for t in self.current_tracks))
+        if self._b64_cache is not None and self._b64_cache[0] == key:
+            return self._b64_cache[1]
+        
         mixed_audio = self.get_mixed_audio()
-        return self.audio_generator.get_audio_base64(mixed_audio)
+        audio_base64 = self.audio_generator.get_audio_base64(mixed_audio)
+        self._b64_cache = (key, audio_base64)
+        return audio_base64
     
-    def load_demo_circuit(self, demo_name: str) -> Dict[str, Any]:
+    def load_demo_circuit(self, demo_name: str) -> GateResult:
         """
         데모 회로 로드
         
@@ -379,37 +526,37 @@ class QuantumCircuitSynthesizer:
             demo_name: 데모 이름 ('superposition', 'mixed_states', 'entanglement')
             
         Returns:
-            로드 결과 정보
+            로드 결과 (GateResult, result['tracks']의 오디오는 트랙 행렬의 뷰 - 다음 게이트 적용 시 덮어씀)
         """
         try:
-            demo_circuits = create_demo_circuits()
+            demo_circuits = _demo_circuits()
             
             if demo_name not in demo_circuits:
-                return {
-                    'success': False,
-                    'error': f"Demo '{demo_name}' not found"
-                }
+                return GateResult(False, error=f"Demo '{demo_name}' not found")
             
-            # 데모 회로 복사
-            demo_engine = demo_circuits[demo_name]
-            self.quantum_engine.circuit = demo_engine.circuit.copy()
+            # 데모 회로 공유 (게이트를 추가할 때만 엔진이 복사)
+            self.quantum_engine.load_shared_circuit(demo_circuits[demo_name])
             
             # 오디오 합성
             result = self._synthesize_current_state('demo', list(range(self.config.num_qubits)))
             
             logger.info(f"Demo circuit '{demo_name}' loaded")
-            return {
-                'success': True,
-                'demo_name': demo_name,
-                'result': result
-            }
+            return GateResult(True, gate_type='demo', demo_name=demo_name, result=result)
             
         except Exception as e:
             logger.error(f"Error loading demo circuit: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return GateResult(False, error=str(e))
+
+
+@lru_cache(maxsize=1)
+def _demo_circuits() -> Dict[str, QuantumCircuit]:
+    """
+    데모 회로 딕셔너리 반환 (처음 한 번만 생성해 모든 신디사이저가 공유, 읽기 전용)
+    
+    Returns:
+        {데모 이름: 양자 회로} 딕셔너리
+    """
+    return {name: engine.circuit for name, engine in create_demo_circuits().items()}
 
 
 def create_preset_synthesizers() -> Dict[str, QuantumCircuitSynthesizer]:
@@ -456,15 +603,15 @@ if __name__ == "__main__":
     # 게이트 적용 테스트
     print("\n1. Adding Hadamard gate to qubit 0...")
     result1 = synth.add_hadamard_gate(0)
-    print(f"Result: {result1['success']}")
+    print(f"Result: {result1.success}")
     
     print("\n2. Adding Pauli-X gate to qubit 1...")
     result2 = synth.add_pauli_x_gate(1)
-    print(f"Result: {result2['success']}")
+    print(f"Result: {result2.success}")
     
     print("\n3. Adding CNOT gate (0 -> 2)...")
     result3 = synth.add_cnot_gate(0, 2)
-    print(f"Result: {result3['success']}")
+    print(f"Result: {result3.success}")
     
     # 트랙 정보 출력
     print("\n4. Track information:")
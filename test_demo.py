@@ -20,7 +20,7 @@ def test_demo_load():
         print(f"\n테스트 중: {demo_name}")
         result = synth.load_demo_circuit(demo_name)
         
-        if result['success']:
+        if result.success:
             print(f"✅ {demo_name} 로드 성공!")
             
             # 회로 정보 확인
@@ -30,7 +30,7 @@ def test_demo_load():
             print(f"  - 큐빗 확률: {viz_data['qubit_probabilities']}")
             
         else:
-            print(f"❌ {demo_name} 로드 실패: {result.get('error', 'Unknown error')}")
+            print(f"❌ {demo_name} 로드 실패: {result.error or 'Unknown error'}")
         
         # 회로 초기화
         synth.reset_circuit()
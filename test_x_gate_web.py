@@ -30,17 +30,17 @@ def test_x_gate_in_web_context():
     # 1. H 게이트 먼저 테스트 (비교용)
     print(f"\n1. H 게이트 테스트 (큐빗 0)")
     result_h = synth.add_hadamard_gate(0)
-    print(f"H 게이트 결과: {result_h['success']}")
+    print(f"H 게이트 결과: {result_h.success}")
     
-    if result_h['success']:
+    if result_h.success:
         viz_data = synth.get_circuit_visualization_data()
         print(f"큐빗 확률: {viz_data['qubit_probabilities']}")
         
         try:
             mixed_audio = synth.get_mixed_audio()
             print(f"H 게이트 오디오 길이: {len(mixed_audio)}")
-            print(f"H 게이트 오디오 최대값: {max(mixed_audio) if len(mixed_audio) > 0 else 0:.6f}")
-            print(f"H 게이트 오디오 RMS: {np.sqrt(np.mean(mixed_audio**2)):.6f}")
+            print(f"H 게이트 오디오 최대값: {float(np.max(mixed_audio)) if mixed_audio.size else 0.0:.6f}")
+            print(f"H 게이트 오디오 RMS: {np.linalg.norm(mixed_audio) / np.sqrt(mixed_audio.size):.6f}")
         except Exception as e:
             print(f"H 게이트 오디오 오류: {e}")
     
@@ -50,17 +50,17 @@ def test_x_gate_in_web_context():
     # 2. X 게이트 테스트
     print(f"\n2. X 게이트 테스트 (큐빗 0)")
     result_x = synth.add_pauli_x_gate(0)
-    print(f"X 게이트 결과: {result_x['success']}")
+    print(f"X 게이트 결과: {result_x.success}")
     
-    if result_x['success']:
+    if result_x.success:
         viz_data = synth.get_circuit_visualization_data()
         print(f"큐빗 확률: {viz_data['qubit_probabilities']}")
         
         try:
             mixed_audio = synth.get_mixed_audio()
             print(f"X 게이트 오디오 길이: {len(mixed_audio)}")
-            print(f"X 게이트 오디오 최대값: {max(mixed_audio) if len(mixed_audio) > 0 else 0:.6f}")
-            print(f"X 게이트 오디오 RMS: {np.sqrt(np.mean(mixed_audio**2)):.6f}")
+            print(f"X 게이트 오디오 최대값: {float(np.max(mixed_audio)) if mixed_audio.size else 0.0:.6f}")
+            print(f"X 게이트 오디오 RMS: {np.linalg.norm(mixed_audio) / np.sqrt(mixed_audio.size):.6f}")
             
             # 오디오 데이터 분석
             non_zero_samples = np.count_nonzero(mixed_audio)
@@ -80,7 +80,7 @@ def test_x_gate_in_web_context():
     # 모든 큐빗에 X 게이트 적용
     for i in range(3):
         result = synth.add_pauli_x_gate(i)
-        print(f"X 게이트 Q{i}: {result['success']}")
+        print(f"X 게이트 Q{i}: {result.success}")
     
     viz_data = synth.get_circuit_visualization_data()
     print(f"모든 X 게이트 후 확률: {viz_data['qubit_probabilities']}")
@@ -88,8 +88,8 @@ def test_x_gate_in_web_context():
     try:
         mixed_audio = synth.get_mixed_audio()
         print(f"모든 X 게이트 오디오 길이: {len(mixed_audio)}")
-        print(f"모든 X 게이트 오디오 최대값: {max(mixed_audio) if len(mixed_audio) > 0 else 0:.6f}")
-        print(f"모든 X 게이트 오디오 RMS: {np.sqrt(np.mean(mixed_audio**2)):.6f}")
+        print(f"모든 X 게이트 오디오 최대값: {float(np.max(mixed_audio)) if mixed_audio.size else 0.0:.6f}")
+        print(f"모든 X 게이트 오디오 RMS: {np.linalg.norm(mixed_audio) / np.sqrt(mixed_audio.size):.6f}")
         
         # 트랙 정보
         track_info = synth.get_track_info()
@@ -115,7 +115,7 @@ def test_x_gate_in_web_context():
     
     for freq, dur, amp, is_on in test_cases:
         toggle_wave = audio_gen.generate_toggle_wave(freq, dur, amp, is_on)
-        print(f"토글웨이브 ({freq}Hz, {dur}s, {amp}, {is_on}): 길이={len(toggle_wave)}, 최대값={max(toggle_wave) if len(toggle_wave) > 0 else 0:.6f}")
+        print(f"토글웨이브 ({freq}Hz, {dur}s, {amp}, {is_on}): 길이={len(toggle_wave)}, 최대값={float(np.max(toggle_wave)) if toggle_wave.size else 0.0:.6f}")
 
 if __name__ == "__main__":
     test_x_gate_in_web_context()
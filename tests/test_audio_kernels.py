@@ -0,0 +1,173 @@
+"""
+오디오 커널 및 WAV 직렬화 테스트 (Numba 커널 ↔ NumPy 대체 구현, PCM 포화 변환, WAV 헤더)
+"""
+
+import importlib.util
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.io import wavfile
+
+import audio_kernels
+from audio_generator import AudioGenerator
+
+SR = 44100
+
+
+@pytest.fixture(scope='module')
+def numpy_kernels():
+    """Numba 없이 불러온 audio_kernels 복사본 (NumPy 대체 구현)"""
+    pytest.importorskip('numba')
+    path = Path(audio_kernels.__file__)
+    spec = importlib.util.spec_from_file_location('audio_kernels_numpy', path)
+    module = importlib.util.module_from_spec(spec)
+
+    saved = sys.modules.get('numba')
+    sys.modules['numba'] = None  # import numba → ImportError
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules['numba'] = saved
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+def _run(kernel, n, *args):
+    """float32 버퍼를 만들어 커널을 실행하고 (버퍼, 반환값) 반환"""
+    out = np.zeros(n, dtype=np.float32)
+    result = kernel(out, *args)
+    return out, result
+
+
+def test_mix_sines_matches_fallback(numpy_kernels):
+    freqs = np.array([261.63, 523.25, 1046.5])
+    amps = np.array([0.5, 0.3, 0.1])
+    phases = np.array([0.0, 0.5, 1.0])
+
+    jit, _ = _run(audio_kernels.mix_sines, 4096, freqs, amps, phases, SR)
+    ref, _ = _run(numpy_kernels.mix_sines, 4096, freqs, amps, phases, SR)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-5)
+
+
+def test_fill_osc_matches_fallback(numpy_kernels):
+    jit, _ = _run(audio_kernels._fill_osc, 4096, SR, 440.0, 0.3, 0.8)
+    ref, _ = _run(numpy_kernels._fill_osc, 4096, SR, 440.0, 0.3, 0.8)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-4)
+
+
+def test_fill_chord_matches_fallback(numpy_kernels):
+    amps = np.array([1.0, 0.5, 0.25])
+    ratios = np.array([1.0, 2.0, 3.0])
+
+    jit, jit_peak = _run(audio_kernels._fill_chord, 4096, SR, 330.0, amps, ratios, 441)
+    ref, ref_peak = _run(numpy_kernels._fill_chord, 4096, SR, 330.0, amps, ratios, 441)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-4)
+    assert jit_peak == pytest.approx(ref_peak, abs=1e-4)
+
+
+def test_fill_sync_matches_fallback(numpy_kernels):
+    freqs = np.array([261.63, 329.63, 392.0])
+    amps = np.array([0.4, 0.3, 0.3])
+
+    jit, jit_peak = _run(audio_kernels._fill_sync, 4096, SR, freqs, amps, 2.0, 441)
+    ref, ref_peak = _run(numpy_kernels._fill_sync, 4096, SR, freqs, amps, 2.0, 441)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-4)
+    assert jit_peak == pytest.approx(ref_peak, abs=1e-4)
+
+
+def test_fill_toggle_matches_fallback(numpy_kernels):
+    jit, jit_peak = _run(audio_kernels._fill_toggle, 4096, SR, 440.0, 0.5, 441)
+    ref, ref_peak = _run(numpy_kernels._fill_toggle, 4096, SR, 440.0, 0.5, 441)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-4)
+    assert jit_peak == pytest.approx(ref_peak, abs=1e-4)
+
+
+@pytest.mark.parametrize('kernel, args', [
+    ('_fill_chord', (SR, 330.0, np.array([1.0, 0.5]), np.array([1.0, 2.0]))),
+    ('_fill_sync', (SR, np.array([261.63, 392.0]), np.array([0.5, 0.5]), 2.0)),
+    ('_fill_toggle', (SR, 440.0, 0.5)),
+])
+def test_zero_fade_matches_fallback(numpy_kernels, kernel, args):
+    # 페이드 길이 0 (out[-0:]이 버퍼 전체가 되는 경우)
+    jit, _ = _run(getattr(audio_kernels, kernel), 1024, *args, 0)
+    ref, _ = _run(getattr(numpy_kernels, kernel), 1024, *args, 0)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-4)
+
+
+@pytest.mark.parametrize('release_start', [800, 300])
+def test_adsr_inplace_matches_fallback(numpy_kernels, release_start):
+    # release_start=300이면 릴리즈가 어택/디케이 구간과 겹침
+    source = np.linspace(-1.0, 1.0, 1000, dtype=np.float32)
+    jit, ref = source.copy(), source.copy()
+
+    audio_kernels._adsr_inplace(jit, 100, 100, 200, release_start, release_start, 0.7)
+    numpy_kernels._adsr_inplace(ref, 100, 100, 200, release_start, release_start, 0.7)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-5)
+
+
+def test_mix_tracks_matches_fallback(numpy_kernels):
+    rng = np.random.default_rng(0)
+    stack = rng.uniform(-1.0, 1.0, (3, 2048)).astype(np.float32)
+    weights = np.array([0.2, 0.5, 0.3])
+    jit = np.empty(2048, dtype=np.float32)
+    ref = np.empty(2048, dtype=np.float32)
+
+    audio_kernels._mix_tracks(stack, weights, jit)
+    numpy_kernels._mix_tracks(stack, weights, ref)
+
+    np.testing.assert_allclose(jit, ref, atol=1e-5)
+
+
+def test_to_pcm16_matches_fallback(numpy_kernels):
+    audio = np.random.default_rng(0).uniform(-1.2, 1.2, 4096).astype(np.float32)
+    jit = np.empty(4096, dtype=np.int16)
+    ref = np.empty(4096, dtype=np.int16)
+
+    audio_kernels._to_pcm16(audio, jit)
+    numpy_kernels._to_pcm16(audio, ref)
+
+    # fastmath 반올림 차이로 최대 1 LSB까지 허용
+    assert np.max(np.abs(jit.astype(np.int32) - ref)) <= 1
+
+
+def test_pcm_saturates_at_full_scale():
+    audio = np.array([-1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5], dtype=np.float32)
+
+    pcm = AudioGenerator(SR)._to_pcm(audio)
+
+    # 범위를 벗어난 샘플은 부호가 뒤집히지 않고 최댓값/최솟값에 고정
+    np.testing.assert_array_equal(
+        pcm, np.array([-32768, -32767, -16384, 0, 16384, 32767, 32767], dtype=np.int16))
+
+
+@pytest.mark.parametrize('num_samples', [0, 1, 44100])
+def test_wav_bytes_match_scipy(num_samples):
+    gen = AudioGenerator(SR)
+    audio = np.sin(np.linspace(0, 200 * np.pi, num_samples, dtype=np.float32)) * 0.9
+
+    wav = gen.to_wav_bytes(audio)
+    expected = io.BytesIO()
+    wavfile.write(expected, SR, gen._to_pcm(audio).copy())
+
+    assert wav == expected.getvalue()
+
+
+def test_wav_buffer_reuse_updates_length_fields():
+    gen = AudioGenerator(SR)
+    gen.to_wav_bytes(np.zeros(44100, dtype=np.float32))
+
+    wav = gen.to_wav_bytes(np.full(100, 0.5, dtype=np.float32))
+
+    rate, data = wavfile.read(io.BytesIO(wav))
+    assert rate == SR
+    np.testing.assert_array_equal(data, np.full(100, 16384, dtype=np.int16))
@@ -0,0 +1,97 @@
+"""
+QuantumSynthEngine NumPy 상태벡터 시뮬레이션 테스트 (Qiskit Statevector와 비교)
+"""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Statevector
+
+from quantum_engine import QuantumSynthEngine, create_demo_circuits
+
+
+def _qiskit_statevector(engine: QuantumSynthEngine) -> np.ndarray:
+    """엔진 회로를 Qiskit Statevector로 시뮬레이션한 기준 상태벡터"""
+    return Statevector.from_instruction(engine.circuit).data
+
+
+@pytest.mark.parametrize('demo_name', ['superposition', 'mixed_states', 'entanglement'])
+def test_demo_circuits_match_qiskit(demo_name):
+    engine = create_demo_circuits()[demo_name]
+
+    assert engine.sv is not None
+    np.testing.assert_allclose(engine.sv, _qiskit_statevector(engine), atol=1e-6)
+
+
+@pytest.mark.parametrize('num_qubits', [1, 2, 3, 5])
+@pytest.mark.parametrize('seed', range(5))
+def test_random_gate_sequences_match_qiskit(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    engine = QuantumSynthEngine(num_qubits)
+
+    for _ in range(25):
+        gate = rng.choice(['h', 'x', 'cx'] if num_qubits > 1 else ['h', 'x'])
+        if gate == 'h':
+            engine.apply_hadamard(int(rng.integers(num_qubits)))
+        elif gate == 'x':
+            engine.apply_pauli_x(int(rng.integers(num_qubits)))
+        else:
+            control, target = rng.choice(num_qubits, size=2, replace=False)
+            engine.apply_cnot(int(control), int(target))
+
+    assert engine.sv is not None
+    np.testing.assert_allclose(engine.sv, _qiskit_statevector(engine), atol=1e-5)
+
+
+def test_circuit_replacement_rebuilds_statevector():
+    engine = QuantumSynthEngine(3)
+    engine.circuit = create_demo_circuits()['entanglement'].circuit.copy()
+
+    np.testing.assert_allclose(engine.sv, _qiskit_statevector(engine), atol=1e-6)
+
+
+def test_in_place_circuit_edit_rebuilds_statevector():
+    engine = QuantumSynthEngine(3)
+    engine.apply_hadamard(0)
+    engine.get_qubit_probabilities_exact()
+
+    # 게이트 메서드를 거치지 않고 회로를 직접 수정
+    engine.circuit.x(1)
+
+    assert engine.get_qubit_probabilities_exact()[1] == pytest.approx(1.0)
+    assert {state.split()[0][1] for state in engine.measure_circuit(256)} == {'1'}
+    np.testing.assert_allclose(engine.sv, _qiskit_statevector(engine), atol=1e-12)
+
+
+def test_statevector_keeps_double_precision():
+    engine = QuantumSynthEngine(2)
+    engine.apply_hadamard(0)
+
+    assert engine.sv.dtype == np.complex128
+    assert engine.get_qubit_probabilities_exact()[0] == pytest.approx(0.5, abs=1e-15)
+
+
+def test_exact_qubit_probabilities_match_qiskit():
+    engine = create_demo_circuits()['mixed_states']
+    reference = Statevector.from_instruction(engine.circuit)
+
+    probs = engine.get_qubit_probabilities_exact()
+
+    for qubit, prob in probs.items():
+        assert prob == pytest.approx(reference.probabilities([qubit])[1], abs=1e-6)
+
+
+def test_sampled_counts_use_measure_all_key_format():
+    engine = QuantumSynthEngine(3)
+    engine.apply_pauli_x(0)
+
+    # measure_all 결과와 같이 '측정 비트 + 공백 + 기존 고전 레지스터' 형식
+    assert engine.measure_circuit(256) == {'001 000': 256}
+
+
+def test_sampled_counts_follow_statevector_support():
+    engine = create_demo_circuits()['entanglement']
+
+    counts = engine.measure_circuit(2048)
+
+    assert sum(counts.values()) == 2048
+    assert {state.split()[0] for state in counts} <= {'000', '111'}
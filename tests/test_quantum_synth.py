@@ -0,0 +1,82 @@
+"""
+QuantumCircuitSynthesizer 테스트 (재생 길이 변경 후 게이트 적용/믹싱)
+"""
+
+import numpy as np
+import pytest
+
+from quantum_synth import QuantumCircuitSynthesizer, SynthConfig
+
+SR = 44100
+
+
+@pytest.fixture
+def synth():
+    return QuantumCircuitSynthesizer(SynthConfig(sample_rate=SR, default_duration=2.0))
+
+
+def _audible_lengths(result):
+    return {len(track.audio_data) for track in result.result['tracks'] if len(track.audio_data) > 0}
+
+
+@pytest.mark.parametrize('duration', [1.0, 3.0])
+def test_gates_after_duration_change(synth, duration):
+    # 앱의 재생 길이 슬라이더와 같이 생성 후 설정만 변경
+    synth.config.default_duration = duration
+    num_samples = int(SR * duration)
+
+    for result in (synth.add_hadamard_gate(0), synth.add_pauli_x_gate(1)):
+        assert result.success, result.error
+        assert _audible_lengths(result) == {num_samples}
+        assert len(synth.get_mixed_audio()) == num_samples
+
+    assert synth.add_cnot_gate(0, 2).success
+    assert len(synth.get_mixed_audio()) == num_samples
+
+
+def test_duration_change_back_and_forth(synth):
+    for duration in (1.0, 3.0, 2.0):
+        synth.config.default_duration = duration
+        synth.reset_circuit()
+        result = synth.add_hadamard_gate(0)
+
+        assert result.success, result.error
+        assert _audible_lengths(result) == {int(SR * duration)}
+        assert len(synth.get_mixed_audio()) == int(SR * duration)
+
+
+def test_silence_follows_duration(synth):
+    synth.config.default_duration = 3.0
+
+    silence = synth.get_mixed_audio()
+
+    assert len(silence) == 3 * SR
+    assert not silence.any()
+
+
+def test_demo_load_after_duration_change(synth):
+    synth.config.default_duration = 1.0
+
+    result = synth.load_demo_circuit('entanglement')
+
+    assert result.success, result.error
+    assert result.demo_name == 'entanglement'
+    assert len(synth.get_mixed_audio()) == SR
+
+
+def test_envelope_toggle_takes_effect(synth):
+    with_envelope = synth._base_waveforms([0], 'h', {0: 0.5})[0].copy()
+
+    synth.config.enable_envelope = False
+    without_envelope = synth._base_waveforms([0], 'h', {0: 0.5})[0]
+
+    assert not np.allclose(with_envelope, without_envelope)
+
+
+def test_waveform_cache_dropped_on_duration_change(synth):
+    assert synth.add_hadamard_gate(0).success
+    synth.config.default_duration = 1.0
+    assert synth.add_hadamard_gate(1).success
+
+    # 이전 재생 길이의 파형은 남지 않음
+    assert {key[3] for key in synth._waveform_cache} == {1.0}